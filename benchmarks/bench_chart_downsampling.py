@@ -0,0 +1,75 @@
+"""Payload size and render time of native charts, raw vs downsampled.
+
+For 10^4 through 10^7 points this reports, per size:
+
+* the Arrow payload a line chart of the raw frame would carry, and the time
+  ``st.line_chart`` takes to build its element (skipped above ``--raw-limit``
+  rows, where building the raw element takes minutes and gigabytes);
+* the time to downsample with ``utils.downsample``, and the payload and
+  element build time of the downsampled chart.
+
+Charts are built in Streamlit's bare mode, so the times cover server-side
+marshalling, not browser rendering. Run from the repository root::
+
+    python benchmarks/bench_chart_downsampling.py [--raw-limit 1000000]
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from utils.downsample import MAX_POINTS, downsample
+
+
+def arrow_bytes(df):
+    """Returns the size of `df` serialized as an Arrow IPC stream."""
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def time_chart(df):
+    start = time.perf_counter()
+    st.line_chart(df)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--raw-limit", type=int, default=1_000_000)
+    parser.add_argument("--max-points", type=int, default=MAX_POINTS)
+    args = parser.parse_args()
+    # Bare-mode element calls log a missing-ScriptRunContext warning each.
+    logging.disable(logging.WARNING)
+
+    rng = np.random.default_rng(0)
+    print(f"{'points':>10}{'raw KB':>12}{'raw ms':>10}"
+          f"{'reduce ms':>11}{'kept':>7}{'down KB':>10}{'down ms':>9}")
+    for exponent in range(4, 8):
+        n = 10 ** exponent
+        df = pd.DataFrame(rng.standard_normal((n, 3)).cumsum(axis=0), columns=['a', 'b', 'c'])
+        raw_kb = arrow_bytes(df) / 1024
+        raw_ms = time_chart(df) * 1000 if n <= args.raw_limit else float("nan")
+
+        start = time.perf_counter()
+        reduced = downsample(df, args.max_points)
+        reduce_ms = (time.perf_counter() - start) * 1000
+        down_kb = arrow_bytes(reduced) / 1024
+        down_ms = time_chart(reduced) * 1000
+        print(f"{n:>10,}{raw_kb:>12,.0f}{raw_ms:>10.0f}"
+              f"{reduce_ms:>11.1f}{len(reduced):>7,}{down_kb:>10.1f}{down_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Interaction latency: full app reruns vs fragment-scoped reruns.
+
+For each scripted interaction this measures, with Streamlit's AppTest runner:
+
+* ``full``: the whole app rerun that the interaction used to trigger
+  (``Streamlit.py`` plus the selected section);
+* ``fragment``: a rerun of only the fragment that owns the widget, which is
+  what the browser now requests for that interaction.
+
+AppTest cannot issue fragment-scoped reruns itself, so the fragment is run as
+a stand-alone script. Both numbers are server-side script time; the network
+and browser share is the same for both. Run from the repository root::
+
+    python benchmarks/bench_fragment_reruns.py [--repeat 20]
+"""
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest
+
+# (section, module, fragment, widget type, widget label, values to cycle)
+INTERACTIONS = [
+    ("Interactive Widgets", "sections.interactive_widgets", "selection_widgets",
+     "selectbox", "Select from dropdown:", ["Red", "Green", "Blue"]),
+    ("Interactive Widgets", "sections.interactive_widgets", "numeric_inputs",
+     "slider", "Select a number (slider)", [10, 50, 90]),
+    ("Interactive Widgets", "sections.interactive_widgets", "text_and_file_inputs",
+     "text_input", "Enter your name:", ["Ada", "Grace", "Linus"]),
+    ("Session State", "sections.session_state", "persisted_text_demo",
+     "text_input", "Type something here:", ["Ada", "Grace", "Linus"]),
+    ("Session State", "sections.session_state", "slider_demo",
+     "slider", "Select a value (with key)", [2, 5, 8]),
+]
+
+
+def _widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def time_interactions(at, kind, label, values, repeat):
+    timings = []
+    for i in range(repeat):
+        _widget(at, kind, label).set_value(values[i % len(values)])
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'interaction':<44}{'full ms':>10}{'fragment ms':>13}{'speedup':>9}")
+    for section, module, fragment, kind, label, values in INTERACTIONS:
+        full = AppTest.from_file(str(ROOT / "Streamlit.py"), default_timeout=60)
+        full.run()
+        full.sidebar.radio[0].set_value(section).run()
+        full_s = time_interactions(full, kind, label, values, args.repeat)
+
+        frag = AppTest.from_string(
+            f"import sys\nsys.path.insert(0, {str(ROOT)!r})\n"
+            f"from {module} import {fragment}\n{fragment}()\n",
+            default_timeout=60,
+        )
+        frag.run()
+        frag_s = time_interactions(frag, kind, label, values, args.repeat)
+        print(f"{fragment + ': ' + label:<44}{full_s * 1000:>10.1f}"
+              f"{frag_s * 1000:>13.1f}{full_s / frag_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
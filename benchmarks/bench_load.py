@@ -0,0 +1,106 @@
+"""Rerun latency under concurrent load against a running demo server.
+
+Opens ``--sessions`` websocket sessions, the way a browser tab does, and has
+each of them select every sidebar section in turn for ``--rounds`` rounds.
+It reports the p50/p99 time from sending the rerun to receiving
+``script_finished``, per section. Point it at ``streamlit run Streamlit.py``
+or at ``serve.py`` to compare one process against a worker pool::
+
+    python serve.py --workers 4 &
+    python benchmarks/bench_load.py [--url ws://localhost:8501] [--sessions 20] [--rounds 3]
+"""
+import argparse
+import asyncio
+import collections
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+from sections import SECTIONS
+
+RADIO_LABEL = "Choose a section:"
+
+
+def _rerun_msg(radio_id=None, section=None):
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    if radio_id is not None:
+        state = msg.rerun_script.widget_states.widgets.add()
+        state.id = radio_id
+        state.string_value = section
+    return msg.SerializeToString()
+
+
+async def _run_script(ws, payload):
+    """Sends a rerun and waits for it to finish; returns (seconds, radio id)."""
+    start = time.perf_counter()
+    await ws.send(payload)
+    radio_id = None
+    while True:
+        msg = ForwardMsg()
+        msg.ParseFromString(await ws.recv())
+        kind = msg.WhichOneof("type")
+        if kind == "delta" and msg.delta.new_element.WhichOneof("type") == "radio":
+            if msg.delta.new_element.radio.label == RADIO_LABEL:
+                radio_id = msg.delta.new_element.radio.id
+        elif kind == "script_finished":
+            if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                continue
+            return time.perf_counter() - start, radio_id
+
+
+async def session(url, rounds, timings, errors):
+    try:
+        async with connect(f"{url}/_stcore/stream", subprotocols=["streamlit"],
+                           max_size=None, open_timeout=30) as ws:
+            _, radio_id = await _run_script(ws, _rerun_msg())
+            for _ in range(rounds):
+                for section in SECTIONS:
+                    seconds, _ = await _run_script(ws, _rerun_msg(radio_id, section))
+                    timings[section].append(seconds)
+    except Exception as e:
+        errors.append(repr(e))
+
+
+def _percentile(values, q):
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] if len(values) > 1 else values[0]
+
+
+async def run(url, sessions, rounds):
+    timings = collections.defaultdict(list)
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(session(url, rounds, timings, errors) for _ in range(sessions)))
+    return timings, errors, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="ws://localhost:8501")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    timings, errors, elapsed = asyncio.run(run(args.url, args.sessions, args.rounds))
+    print(f"{'section':<36}{'reruns':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for section in SECTIONS:
+        values = timings.get(section)
+        if values:
+            print(f"{section:<36}{len(values):>8}{_percentile(values, 50) * 1000:>10.1f}"
+                  f"{_percentile(values, 99) * 1000:>10.1f}")
+    total = sum(len(v) for v in timings.values())
+    print(f"{total} reruns in {elapsed:.1f}s ({total / elapsed:.1f}/s), {len(errors)} failed sessions")
+    for error in errors[:5]:
+        print("  " + error)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Headless per-section performance check with baseline comparison.
+
+Runs the app with Streamlit's AppTest runner (no browser or server). Each
+sidebar section gets a fresh interpreter, so peak RSS is per section. For
+each section it records:
+
+* ``load_ms``: the first rerun that selects the section (imports, cold caches);
+* ``rerun_ms``: median warm rerun of the section;
+* ``interaction_ms``: median rerun after the section's scripted interactions
+  (button clicks, slider moves, form submits, file uploads);
+* ``payload_bytes``: serialized ForwardMsg bytes of a warm rerun;
+* ``peak_rss_mb``: peak resident memory of the interpreter.
+
+The run is offline: remote media is replaced by generated placeholder files
+in a temporary store. The on-disk frame and dataset caches also point at
+temporary directories, so every run starts from the same cold state, and the
+prewarmed resources are built before anything is timed. Run from the repository root::
+
+    python benchmarks/bench_regression.py --save benchmarks/baseline.json
+    python benchmarks/bench_regression.py --compare benchmarks/baseline.json [--tolerance 0.25]
+
+With ``--compare`` the exit status is 1 if any metric got worse than the
+baseline by more than the tolerance, so it can gate Streamlit.py changes
+or a Streamlit upgrade.
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+METRICS = ("load_ms", "rerun_ms", "interaction_ms", "payload_bytes", "peak_rss_mb")
+# Differences below these are noise regardless of the relative tolerance.
+ABSOLUTE_SLACK = {"load_ms": 50, "rerun_ms": 10, "interaction_ms": 10, "payload_bytes": 1024, "peak_rss_mb": 10}
+CSV_UPLOAD = ("data.csv", b"a,b,c\n" + b"".join(b"%d,%d,x%d\n" % (i, i * 2, i) for i in range(1000)), "text/csv")
+
+
+def _widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def _set(kind, label, value):
+    return lambda at: _widget(at, kind, label).set_value(value)
+
+
+def _click(label):
+    return lambda at: _widget(at, "button", label).click()
+
+
+def _submit_form(at):
+    _widget(at, "text_input", "Name").set_value("Ada")
+    _widget(at, "number_input", "Age").set_value(36)
+    _widget(at, "button", "Submit Form").click()
+
+
+# Section -> interactions; each one is applied and followed by a rerun.
+INTERACTIONS = {
+    "Data Display": [_click("Add 2 More Rows")],
+    "Charts & Maps": [_set("slider", "Zoom (row range)", (0, 50_000))],
+    "Interactive Widgets": [
+        _click("Click Me!"),
+        _set("slider", "Select a number (slider)", 75),
+        _set("file_uploader", "Upload a CSV file", CSV_UPLOAD),
+    ],
+    "Layout Options": [_submit_form, _set("slider", "Slider 2", 7)],
+    "Session State": [_click("Increment Counter")],
+    "Advanced & Experimental Features": [_click("Action 1")],
+}
+
+
+def _stub_media():
+    """Serves generated placeholders instead of fetching remote media."""
+    from PIL import Image
+    import utils.media as media
+
+    def download(entry):
+        if entry["type"] in ("image/jpeg", "image/png"):
+            buf = io.BytesIO()
+            Image.new("RGB", (400, 200), "gray").save(buf, format=entry["type"].split("/")[1])
+            return buf.getvalue()
+        if entry["type"] == "image/svg+xml":
+            return b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+        return bytes(1024)
+
+    media._download = download
+    media.STORE_DIR = Path(tempfile.mkdtemp(prefix="bench-media-"))
+
+
+def _isolate_caches():
+    """Points the on-disk caches at empty temporary directories."""
+    import utils.datasets as datasets
+    import utils.disk_cache as disk_cache
+
+    # Must run before sections.caching creates its FrameCache.
+    disk_cache.DEFAULT_DIR = Path(tempfile.mkdtemp(prefix="bench-frames-"))
+    datasets.DATASET_DIR = Path(tempfile.mkdtemp(prefix="bench-datasets-"))
+
+
+def _count_payload():
+    """Counts the serialized bytes of every ForwardMsg the runner enqueues."""
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    counter = {"bytes": 0}
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(self, msg):
+        counter["bytes"] += msg.ByteSize()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+    return counter
+
+
+def _timed_run(at, counter):
+    counter["bytes"] = 0
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        errors = [e.value for e in at.exception if "demo exception" not in e.value]
+        if errors:
+            raise RuntimeError(errors[0])
+    return elapsed, counter["bytes"]
+
+
+def measure_section(section, repeat):
+    """Measures one section in this interpreter; returns its metrics."""
+    from streamlit.testing.v1 import AppTest
+
+    from utils.prewarm import warm_now
+
+    logging.disable(logging.WARNING)
+    _stub_media()
+    _isolate_caches()
+    # Build the prewarmed resources up front instead of on the prewarm pool
+    # while the section is being timed.
+    warm_now("sections.caching")
+    counter = _count_payload()
+    at = AppTest.from_file(str(ROOT / "Streamlit.py"), default_timeout=120)
+    at.run()
+    at.sidebar.radio[0].set_value(section)
+    load_ms, _ = _timed_run(at, counter)
+    reruns = [_timed_run(at, counter) for _ in range(repeat)]
+    interactions = []
+    for _ in range(repeat):
+        for interact in INTERACTIONS.get(section, []):
+            interact(at)
+            interactions.append(_timed_run(at, counter)[0])
+    return {
+        "load_ms": load_ms,
+        "rerun_ms": statistics.median(ms for ms, _ in reruns),
+        "interaction_ms": statistics.median(interactions) if interactions else None,
+        "payload_bytes": statistics.median(size for _, size in reruns),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def measure_all(repeat):
+    from sections import SECTIONS
+
+    results = {}
+    for section in SECTIONS:
+        out = subprocess.run(
+            [sys.executable, __file__, "--section", section, "--repeat", str(repeat)],
+            capture_output=True, text=True, cwd=ROOT,
+            env={**os.environ, "DEMO_MEDIA_OFFLINE": "0"},
+        )
+        if out.returncode:
+            raise RuntimeError(f"{section} failed:\n{out.stderr}")
+        results[section] = json.loads(out.stdout.splitlines()[-1])
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Yields `(section, metric, baseline value, new value)` for each regression."""
+    for section, metrics in results.items():
+        for metric in METRICS:
+            old, new = baseline.get(section, {}).get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > ABSOLUTE_SLACK[metric]:
+                yield section, metric, old, new
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:,.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail on regressions against a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--section", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.section:
+        print(json.dumps(measure_section(args.section, args.repeat)))
+        return 0
+
+    results = measure_all(args.repeat)
+    print(f"{'section':<36}" + "".join(f"{m:>16}" for m in METRICS))
+    for section, metrics in results.items():
+        print(f"{section:<36}" + "".join(f"{_fmt(metrics[m]):>16}" for m in METRICS))
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        found = list(regressions(results, baseline, args.tolerance))
+        for section, metric, old, new in found:
+            print(f"REGRESSION {section} {metric}: {_fmt(old)} -> {_fmt(new)}")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Startup/import-time benchmark for the lazily loaded demo sections.
+
+For every sidebar section this starts a fresh interpreter and measures the
+import cost paid before the section can render its first element:
+
+* ``eager``: the old single-script layout, which imported pandas, numpy and
+  matplotlib.pyplot on every run regardless of the selected section.
+* ``lazy``: only the section module (and whatever it imports itself).
+
+Run from the repository root::
+
+    python benchmarks/bench_section_imports.py [--repeat 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+EAGER_IMPORTS = "import pandas, numpy, matplotlib.pyplot"
+
+_PROBE = """
+import time, importlib
+import streamlit
+start = time.perf_counter()
+{pre}
+importlib.import_module({module!r})
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(module, eager, cwd=ROOT):
+    """Returns the seconds spent importing `module` in a fresh interpreter."""
+    code = _PROBE.format(pre=EAGER_IMPORTS if eager else "", module=module)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, check=True,
+        capture_output=True, text=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from sections import SECTIONS
+
+    print(f"{'section':<36}{'eager ms':>10}{'lazy ms':>10}{'saved':>8}")
+    for title, module in SECTIONS.items():
+        eager = statistics.median(time_import(module, True) for _ in range(args.repeat))
+        lazy = statistics.median(time_import(module, False) for _ in range(args.repeat))
+        saved = 1 - lazy / eager if eager else 0.0
+        print(f"{title:<36}{eager * 1000:>10.1f}{lazy * 1000:>10.1f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Page modules for the demo app, one per sidebar section.
+
+Each module exposes a ``render()`` function and is imported lazily by
+``Streamlit.py`` only when its section is selected, so heavy dependencies
+(pandas, numpy, matplotlib) are loaded only by the sections that use them.
+"""
+
+# Maps each sidebar entry to the module that renders it. Modules are imported
+# only when their section is picked, so e.g. matplotlib is never loaded for
+# the "Introduction" page.
+SECTIONS = {
+    "Introduction": "sections.introduction",
+    "Text Elements": "sections.text_elements",
+    "Data Display": "sections.data_display",
+    "Charts & Maps": "sections.charts_maps",
+    "Media Elements": "sections.media_elements",
+    "Interactive Widgets": "sections.interactive_widgets",
+    "Layout Options": "sections.layout_options",
+    "Session State": "sections.session_state",
+    "Caching": "sections.caching",
+    "Status & Progress": "sections.status_progress",
+    "Custom Components": "sections.custom_components",
+    "Advanced & Experimental Features": "sections.advanced",
+}
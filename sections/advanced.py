@@ -0,0 +1,94 @@
+"""Advanced & Experimental Features section of the demo app."""
+import streamlit as st
+import pandas as pd
+from utils.downloads import deferred, iter_bytes
+from utils.media import media_url
+from utils.plotting import line_png, new_figure
+
+
+def render():
+    """Renders the Advanced & Experimental Features section."""
+    st.header("11. Advanced & Experimental Features")
+    st.write("Explore advanced, experimental, and less-common Streamlit features.")
+    st.subheader("st.toast: Transient Notification")
+    st.toast("This is a toast notification!", icon="🎉")
+    st.subheader("st.exception: Display Exception Traceback")
+    class DemoException(Exception):
+        pass
+    exc = DemoException("This is a demo exception for st.exception!")
+    st.exception(exc)
+    st.subheader("st.stop: Stop Script Execution")
+    st.write("The code below will not run if you uncomment st.stop().")
+    # st.stop()
+    st.info("Uncomment st.stop() above to see script execution halt.")
+    st.subheader("st.metric: KPI/Number Display")
+    st.metric(label="Active Users", value=1234, delta="+56")
+    st.metric(label="Conversion Rate", value="5.2%", delta="-0.3%", delta_color="inverse")
+    st.subheader("st.empty: Dynamic Placeholder")
+    placeholder = st.empty()
+    if st.button("Show Dynamic Message in Placeholder"):
+        placeholder.success("This message was inserted dynamically!")
+    st.subheader("st.form with Multiple Submit Buttons")
+    with st.form("multi_action_form"):
+        a = st.text_input("Value A")
+        b = st.text_input("Value B")
+        submit1 = st.form_submit_button("Action 1")
+        submit2 = st.form_submit_button("Action 2")
+        if submit1:
+            st.success(f"Action 1 submitted: {a}")
+        if submit2:
+            st.success(f"Action 2 submitted: {b}")
+    st.subheader("st.form_submit_button with on_click")
+    def on_form_submit():
+        st.toast("Form submitted via on_click!", icon="✅")
+    with st.form("form_on_click"):
+        st.text_input("Type something")
+        st.form_submit_button("Submit (on_click)", on_click=on_form_submit)
+    st.subheader("st.write with Multiple Arguments/Objects")
+    st.write("Multiple values:", 1, 2, 3, {"a": 10, "b": 20})
+    st.write(pd.DataFrame({"A": [1,2], "B": [3,4]}), new_figure()[0])
+    st.subheader("st.markdown with unsafe_allow_html")
+    st.markdown('<span style="color: red; font-weight: bold;">This is red HTML text!</span>', unsafe_allow_html=True)
+    st.subheader("st.columns with Unequal Widths")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.info("Wider column")
+    with col2:
+        st.warning("Narrower column")
+    st.subheader("Nested st.container")
+    with st.container():
+        st.write("Outer container")
+        with st.container():
+            st.write("Inner container")
+    st.subheader("st.caption for Images/Charts")
+    st.image(media_url("picsum_200"), caption="Image with caption")
+    st.caption("This is a caption for the image above.")
+    st.subheader("st.download_button with Binary Data (Download Plot)")
+    def plot_png_chunks():
+        yield from iter_bytes(line_png([0,1,2], [10,20,15]))
+    st.download_button("Download Plot as PNG", data=deferred(plot_png_chunks), file_name="plot.png", mime="image/png")
+    st.subheader("st.experimental_rerun")
+    if st.button("Rerun App Now"):
+        st.experimental_rerun()
+    st.subheader("st.query_params (New API)")
+    st.write("Current query params:", st.query_params)
+    if st.button("Set Query Param foo=bar (New API)"):
+        st.query_params["foo"] = "bar"
+        st.info("Query param set! Reload to see effect.")
+    if hasattr(st, "query_params"):
+        st.subheader("st.query_params (New API)")
+        st.write(st.query_params)
+    st.subheader("st.secrets (Secure Credentials)")
+    st.write("st.secrets is used for secure credentials. Example:")
+    st.code("st.secrets['db_password'] # Add secrets in .streamlit/secrets.toml")
+    if hasattr(st, "experimental_user"):
+        st.subheader("st.experimental_user (User Info)")
+        st.write(st.experimental_user)
+    if hasattr(st, "experimental_connection"):
+        st.subheader("st.experimental_connection (Database Connection)")
+        st.write("See docs for usage.")
+    st.subheader("st.session_state Callback with Arguments")
+    def cb_with_args(arg):
+        st.toast(f"Callback called with arg: {arg}")
+    st.button("Callback with Arg", on_click=cb_with_args, args=("Hello!",))
+    st.info("This section covers advanced and experimental Streamlit features. Some features may require the latest Streamlit version or special configuration.")
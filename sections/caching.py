@@ -0,0 +1,66 @@
+"""Caching section of the demo app."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import time
+from utils.disk_cache import FrameCache, frame_cached
+from utils.paging import paged_dataframe
+from utils.prewarm import refresh_all, warm_resource
+
+# Memory tier capped at 64 MB over Arrow files that survive restarts; entries
+# written by an earlier process are loaded back as soon as this module loads.
+DATA_CACHE = FrameCache(max_bytes=64 * 1024 * 1024, ttl=3600)
+DATA_CACHE.warm()
+
+@frame_cached(DATA_CACHE)
+def load_expensive_data():
+    """Simulates loading a large dataset."""
+    time.sleep(2)
+    data = pd.DataFrame(
+        np.random.randn(500, 5),
+        columns=[f"Col {i+1}" for i in range(5)]
+    )
+    return data
+
+@warm_resource
+def load_expensive_model():
+    """Simulates loading a large machine learning model."""
+    time.sleep(3) 
+    return "Simulated ML Model (Global Resource)"
+
+
+def render():
+    """Renders the Caching section."""
+    st.header("8. Caching: Optimizing Performance")
+    st.write("Caching helps speed up your app by storing results of expensive computations.")
+    st.subheader("`@st.cache_data` for Data Loading")
+    st.markdown("This caches the return value of functions that load or transform data. Each user gets their own cached copy.")
+    st.markdown("Here the data is kept in a two-tier cache instead: a size-bounded in-memory LRU over Arrow files on disk, so it survives server restarts.")
+    st.write("Loading data... (This will be slow on first run, fast on subsequent runs)")
+    data_loaded = load_expensive_data()
+    paged_dataframe(data_loaded, key="expensive_data", page_size=5)
+    st.success("Data loaded (possibly from cache)!")
+    st.caption("Cache stats: " + ", ".join(f"{name}={value}" for name, value in DATA_CACHE.stats().items()))
+
+    st.subheader("`@st.cache_resource` for Global Resources")
+    st.markdown("This caches global resources like ML models or database connections. The cached object is shared across all users and sessions.")
+    st.markdown("Here the model is registered with `@warm_resource` instead, which builds it on a background thread when the server starts, so no session pays the load time.")
+    st.write("Loading ML Model... (already warm unless the server just started)")
+    model = load_expensive_model()
+    st.write(f"Model loaded: {model}")
+    st.success("Model loaded (possibly from cache)!")
+
+    st.subheader("Clearing Cache")
+    st.markdown("You can clear specific caches or all caches.")
+    if st.button("Clear Data Cache (`@st.cache_data`)"):
+        load_expensive_data.clear()
+        st.info("`@st.cache_data` cleared. Next data load will be slow.")
+    if st.button("Clear Resource Cache (`@st.cache_resource`)"):
+        load_expensive_model.refresh()
+        st.info("The model is being rebuilt in the background; the current instance keeps serving until it is ready.")
+    if st.button("Clear ALL Caches"):
+        st.cache_data.clear()
+        DATA_CACHE.clear()
+        st.cache_resource.clear()
+        refresh_all()
+        st.info("All caches cleared. All subsequent expensive operations will rerun.")
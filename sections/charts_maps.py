@@ -0,0 +1,45 @@
+"""Charts & Maps section of the demo app."""
+import streamlit as st
+from utils.datasets import dataset_key, get_dataset, shared_dataset
+from utils.downsample import downsampled_chart
+from utils.geo import clustered_map
+from utils.plotting import histogram_png
+
+
+def render():
+    """Renders the Charts & Maps section."""
+    st.header("3. Charts and Visualizations")
+    st.write("Streamlit integrates with popular charting libraries and offers simplified native charts.")
+    chart_data = get_dataset("chart_data")
+    st.subheader("Simple Charts (Native Streamlit)")
+    st.markdown("`st.line_chart()`: Displays a line chart.")
+    downsampled_chart("line_chart", chart_data, key="line")
+    st.markdown("`st.bar_chart()`: Displays a bar chart.")
+    downsampled_chart("bar_chart", chart_data, key="bar")
+    st.markdown("`st.area_chart()`: Displays an area chart.")
+    downsampled_chart("area_chart", chart_data, key="area")
+    st.markdown("`st.scatter_chart()`: Displays a scatter chart.")
+    downsampled_chart("scatter_chart", chart_data, key="scatter", x='a', y='b', color='c')
+    st.subheader("Downsampled Large Series")
+    st.markdown("Charts with more points than pixels are reduced server-side to each bucket's min/max. Narrow the zoom range to see more detail.")
+    downsampled_chart("line_chart", shared_dataset("large_series"), key="large_line")
+    st.subheader("Maps (`st.map`)")
+    st.markdown("`st.map()`: Plots data points on a map, great for geospatial data.")
+    map_data = get_dataset("map_data")
+    clustered_map(map_data, key="map")
+    st.markdown("Large point sets are indexed once on a grid and sent as clusters for the current viewport.")
+    clustered_map(
+        shared_dataset("large_map_data"), key="large_map",
+        source=dataset_key("large_map_data")
+    )
+    st.subheader("Advanced Chart Integrations (Matplotlib Example)")
+    st.markdown("`st.pyplot()`: Displays Matplotlib figures for custom plots. Here the figure is rasterized once and its cached PNG is shown with `st.image()`.")
+    st.image(histogram_png(
+        get_dataset("histogram_values")["value"], bins=20,
+        title="Matplotlib Histogram Example"
+    ))
+    st.write("""
+    Streamlit also supports `st.altair_chart()`, `st.plotly_chart()`, `st.bokeh_chart()`,
+    `st.pydeck_chart()`, `st.vega_lite_chart()`, and `st.graphviz_chart()` for more
+    specialized and interactive visualizations.
+    """)
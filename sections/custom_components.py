@@ -0,0 +1,30 @@
+"""Custom Components section of the demo app."""
+import streamlit as st
+
+
+def render():
+    """Renders the Custom Components section."""
+    st.header("10. Custom Components: Extending Streamlit")
+    st.write("For functionalities not natively supported, custom components allow integration of web technologies.")
+    st.subheader("Embedding HTML (`st.components.v1.html`)")
+    st.markdown("You can embed raw HTML directly into your app.")
+    st.components.v1.html(
+        """
+        <div style=\"background-color: #f0f2f6; padding: 20px; border-radius: 10px;\">
+          <h3 style=\"color: #333;\">Hello from Custom HTML!</h3>
+          <p>This content is rendered directly from an HTML string.</p>
+          <button onclick=\"alert('Button clicked in HTML!')\">Click Me</button>
+        </div>
+        """,
+        height=150
+    )
+    st.subheader("Embedding Iframes (`st.components.v1.iframe`)")
+    st.markdown("Embed content from other websites or local web apps via an iframe.")
+    st.components.v1.iframe("https://docs.streamlit.io/get-started", height=400, scrolling=True)
+    st.info("This iframe displays a section of the Streamlit documentation.")
+    st.write("""
+    For more complex, bi-directional custom components, you would typically develop
+    a separate frontend (e.g., using React) and use `st.components.v1.declare_component`
+    to establish communication between Python and JavaScript. This allows for
+    infinite extensibility of Streamlit's capabilities.
+    """)
@@ -0,0 +1,100 @@
+"""Data Display section of the demo app."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import threading
+import time
+from streamlit.delta_generator import DeltaGenerator
+from utils.datasets import dataset_table, get_dataset
+from utils.paging import paged_dataframe
+from utils.streaming import StreamingTable
+from utils.styling import styled_frame
+
+
+def render():
+    """Renders the Data Display section."""
+    st.header("2. Data Display Elements")
+    st.write("Streamlit allows displaying tabular data in various interactive and static formats.")
+    st.subheader("Interactive DataFrames (`st.dataframe`)")
+    st.markdown("`st.dataframe()` displays an interactive table, supporting various data types. It allows sorting, searching, and styling.")
+    data_for_df = get_dataset("data_for_df")
+    paged_dataframe(data_for_df, key="data_for_df", page_size=5)
+    st.markdown("#### Styling with Pandas Styler")
+    st.write("You can apply custom styling using `pandas.Styler`.")
+    styled_df = get_dataset("styled_df")
+    st.dataframe(styled_frame(
+        styled_df,
+        ("highlight_max", {"axis": 0}),
+        ("background_gradient", {"cmap": "viridis"}),
+    ))
+    st.markdown("#### Column Configuration")
+    st.write("Customize column display, e.g., hide index, set column order, format numbers.")
+    config_df = pd.DataFrame({
+        'Sales': [100, 200, 150, 300],
+        'Product': ['A', 'B', 'C', 'D'],
+        'Date': pd.to_datetime(['2023-01-01', '2023-01-05', '2023-01-10', '2023-01-15']),
+        'Price': [10.5, 20.0, 5.75, 12.25]
+    })
+    column_order = ['Product', 'Sales', 'Date', 'Price']
+    st.dataframe(
+        config_df,
+        hide_index=True,
+        column_order=column_order,
+        column_config={
+            "Sales": st.column_config.NumberColumn(
+                "Total Sales", format="$%d"
+            ),
+            "Date": st.column_config.DateColumn(
+                "Sale Date", format="YYYY/MM/DD"
+            ),
+            "Price": st.column_config.NumberColumn(
+                "Unit Price", format="$%.2f"
+            )
+        }
+    )
+    st.markdown("#### Arrow Tables")
+    st.write("A `pyarrow.Table` memory-mapped from a Feather file is displayed without a pandas round-trip.")
+    paged_dataframe(dataset_table("large_series"), key="large_series_table", page_size=10)
+    st.markdown("#### Interactive Selection (`on_select`)")
+    st.write("Enable row/column selection to trigger actions.")
+    selection_df = pd.DataFrame(
+        {"col1": [1, 2, 3], "col2": ["A", "B", "C"], "col3": [True, False, True]}
+    )
+    selected_rows = paged_dataframe(selection_df, key="selection_df", on_select="rerun", selection_mode="single-row")
+    if len(selected_rows):
+        st.write("Selected rows:", selection_df.iloc[selected_rows])
+    st.subheader("Static Tables (`st.table`)")
+    st.markdown("`st.table()` displays a static table, useful for small, fixed datasets.")
+    static_data = pd.DataFrame({
+        'Category': ['Fruit', 'Vegetable', 'Dairy'],
+        'Items': ['Apple', 'Carrot', 'Milk']
+    })
+    st.table(static_data)
+    st.subheader("Dynamically Adding Rows (`element.add_rows`)")
+    st.write("You can append new rows to existing dataframe elements.")
+    initial_df = get_dataset("initial_rows")
+    table_slot = st.empty()
+    my_dynamic_table = table_slot.dataframe(initial_df)
+    if st.button("Add 2 More Rows"):
+        new_rows = pd.DataFrame(np.random.rand(2, 2), columns=['X', 'Y'])
+        if hasattr(DeltaGenerator, "add_rows"):
+            my_dynamic_table.add_rows(new_rows)
+        else:
+            # Newer Streamlit releases removed add_rows; redraw instead.
+            table_slot.dataframe(pd.concat([initial_df, new_rows], ignore_index=True))
+        st.success("Rows added!")
+    st.subheader("Live Streaming with a Bounded Buffer")
+    st.write("A background thread produces rows; only new rows are sent, and the chart keeps the latest 200.")
+    if st.button("Stream 3 Seconds of Metrics"):
+        live_chart = StreamingTable(["cpu", "memory"], max_rows=200, kind="line_chart")
+        def produce():
+            rng = np.random.default_rng()
+            end = time.monotonic() + 3
+            try:
+                while time.monotonic() < end and live_chart.put(rng.random(2)):
+                    time.sleep(0.002)
+            finally:
+                live_chart.close()
+        threading.Thread(target=produce, daemon=True).start()
+        live_chart.run()
+        st.success("Stream finished!")
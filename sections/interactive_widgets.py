@@ -0,0 +1,125 @@
+"""Interactive Widgets section of the demo app."""
+import streamlit as st
+import time
+from utils.datasets import shared_dataset
+from utils.downloads import deferred, iter_bytes
+from utils.edit_log import logged_editor
+from utils.fragments import tracked_fragment
+from utils.ingest import preview_upload
+from utils.paging import paged_dataframe
+from utils.streaming import stream_text
+
+@tracked_fragment()
+def buttons_and_links():
+    """Buttons, the download button and a link button."""
+    st.subheader("Buttons and Links")
+    if st.button("Click Me!"):
+        st.success("Button clicked!")
+    text_contents = "This is some dummy text for download."
+    st.download_button(
+        label="Download Dummy Text",
+        data=deferred(iter_bytes, text_contents.encode()),
+        file_name="dummy_text.txt",
+        mime="text/plain"
+    )
+    st.link_button("Go to Streamlit.io", url="https://streamlit.io")
+
+@tracked_fragment()
+def selection_widgets():
+    """Checkbox, radio, selectbox, multiselect, toggle and color picker."""
+    st.subheader("Selection Widgets")
+    show_content = st.checkbox("Show additional content?")
+    if show_content:
+        st.info("This content is shown because the checkbox is checked.")
+    radio_choice = st.radio("Choose an option:", ["Option 1", "Option 2", "Option 3"])
+    st.write(f"You selected: {radio_choice}")
+    select_box_choice = st.selectbox("Select from dropdown:", ["Red", "Green", "Blue"])
+    st.write(f"Dropdown selected: {select_box_choice}")
+    multi_select_choices = st.multiselect("Select multiple colors:", ["Red", "Green", "Blue"])
+    st.write(f"You selected: {', '.join(multi_select_choices)}")
+    toggle_state = st.toggle("Activate Feature Toggle")
+    if toggle_state:
+        st.success("Feature is ON!")
+    else:
+        st.warning("Feature is OFF.")
+    color = st.color_picker("Pick a color", '#00f900')
+    st.write('The current color is', color)
+
+@tracked_fragment()
+def numeric_inputs():
+    """Slider, number input, date and time inputs."""
+    st.subheader("Numeric and Date/Time Inputs")
+    num_slider = st.slider("Select a number (slider)", 0, 100, 25)
+    st.write(f"Slider value: {num_slider}")
+    num_input = st.number_input("Enter a number (numeric input)", 0, 100, 50)
+    st.write(f"Numeric input value: {num_input}")
+    today = st.date_input("Select a date")
+    st.write(f"Selected date: {today}")
+    now = st.time_input("Select a time")
+    st.write(f"Selected time: {now}")
+
+@tracked_fragment()
+def text_and_file_inputs():
+    """Text input, text area and the CSV uploader."""
+    st.subheader("Text and File Inputs")
+    user_name = st.text_input("Enter your name:")
+    if user_name:
+        st.write(f"Hello, {user_name}!")
+    long_text = st.text_area("Enter a multi-line text:")
+    if long_text:
+        st.write("You entered:")
+        st.info(long_text)
+    uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
+    if uploaded_file is not None:
+        df_uploaded, schema = preview_upload(uploaded_file)
+        st.success("File uploaded successfully!")
+        st.dataframe(df_uploaded)
+        st.caption("Sniffed schema: " + ", ".join(f"{col} ({dtype})" for col, dtype in schema.items()))
+
+@tracked_fragment()
+def data_editor_demo():
+    """An editable frame and the edits made to it."""
+    st.subheader("Data Editor")
+    size = st.radio("Rows to edit:", ["3", "100,000"], horizontal=True)
+    editable_df = shared_dataset("editable_df" if size == "3" else "editable_large")
+    st.write("Edit the DataFrame directly:")
+    edits = logged_editor(editable_df, key=f"data_editor_{size}", num_rows="dynamic")
+    st.write("Changes in this run:", edits.changes)
+    st.caption(", ".join(f"{count} {what}" for what, count in edits.summary().items()))
+    st.write("Edited data:")
+    paged_dataframe(edits.frame(), key=f"edited_data_{size}", page_size=10, source=edits.version)
+
+
+def simulated_reply(message):
+    """Yields an LLM-style reply to `message` one word at a time."""
+    reply = (
+        f"You said: {message}\n\n"
+        "This reply arrives one token at a time, like a language model's output. "
+        "Tokens are batched into a few redraws per second of a single element."
+    )
+    for word in reply.split(" "):
+        yield word + " "
+        time.sleep(0.02)
+
+
+def render():
+    """Renders the Interactive Widgets section."""
+    st.header("5. Interactive Widgets: Capturing User Input")
+    st.write("Streamlit's widgets allow users to interact with the application and provide input.")
+    st.caption("Each group below is a fragment: interacting with a widget reruns only its own group.")
+    buttons_and_links()
+    selection_widgets()
+    numeric_inputs()
+    text_and_file_inputs()
+    st.subheader("Chat Input")
+    st.caption("Replies are streamed token by token and redrawn at most 15 times per second.")
+    if "chat_history" not in st.session_state:
+        st.session_state.chat_history = []
+    for role, text in st.session_state.chat_history:
+        st.chat_message(role).markdown(text)
+    chat_message = st.chat_input("Say something about Streamlit...")
+    if chat_message:
+        st.chat_message("user").markdown(chat_message)
+        reply = stream_text(simulated_reply(chat_message), st.chat_message("assistant"))
+        st.session_state.chat_history += [("user", chat_message), ("assistant", reply)]
+    data_editor_demo()
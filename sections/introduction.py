@@ -0,0 +1,41 @@
+"""Introduction section of the demo app."""
+import streamlit as st
+
+
+def render():
+    """Renders the Introduction section."""
+    st.header("Welcome to the Streamlit Power Demo!")
+    st.write("""
+    Streamlit simplifies the creation of interactive web applications using pure Python.
+    Its core strength lies in its ability to turn data scripts into shareable web apps
+    in minutes, without requiring front-end development expertise.
+    """)
+    st.info("Interact with the widgets and observe how the application updates in real-time!")
+    st.markdown("---")
+    st.subheader("The Streamlit Execution Model")
+    st.write("""
+    A fundamental concept in Streamlit is its execution model: the entire Python script
+    reruns from top to bottom whenever a user interacts with a widget or the source code is modified.
+    This creates a fast interactive loop, where widgets are treated like variables that update
+    with user input.
+    """)
+    st.code("""
+    import streamlit as st
+    x = st.slider('x') # This is a widget
+    st.write(x, 'squared is', x * x)
+    """)
+    st.write("On first run, the app above outputs '0 squared is 0'. Interacting with the slider reruns the script, updating 'x'.")
+    st.markdown("---")
+    st.subheader("Magic Commands and `st.write()`")
+    st.write("""
+    `st.write()` is Streamlit's versatile "Swiss Army knife" for displaying content.
+    It intelligently renders various data types. You can also use "magic commands"
+    by simply typing a variable or expression on a line.
+    """)
+    st.code("""
+    import streamlit as st
+    st.write("Hello, Streamlit!")
+    my_variable = "This is a magic string!"
+    my_variable # Magic command
+    """)
+    st.write("Try typing `st.session_state` on a line in your actual app to see its contents!")
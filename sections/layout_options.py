@@ -0,0 +1,57 @@
+"""Layout Options section of the demo app."""
+import streamlit as st
+import pandas as pd
+from utils.datasets import get_dataset
+from utils.media import media_url
+
+
+def render():
+    """Renders the Layout Options section."""
+    st.header("6. Layout and Structure")
+    st.write("Organize your application content effectively using Streamlit's layout options.")
+    st.subheader("Columns (`st.columns`)")
+    st.markdown("Divide your content into side-by-side columns.")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.success("This is Column 1")
+        st.button("Button 1")
+    with col2:
+        st.info("This is Column 2")
+        st.slider("Slider 2", 0, 10)
+    with col3:
+        st.warning("This is Column 3")
+        st.text_input("Input 3")
+    st.subheader("Containers (`st.container`)")
+    st.markdown("Group related elements together.")
+    with st.container(border=True):
+        st.write("This content is inside a container.")
+        st.checkbox("Container checkbox")
+    st.subheader("Expanders (`st.expander`)")
+    st.markdown("Hide and reveal content to save space.")
+    with st.expander("Click to see more details"):
+        st.write("This is hidden content that appears when the expander is open.")
+        st.image(media_url("picsum_200x100"), caption="Image inside expander")
+    st.subheader("Tabs (`st.tabs`)")
+    st.markdown("Organize content into distinct, navigable tabs.")
+    tab1, tab2 = st.tabs(["Data View", "Chart View"])
+    with tab1:
+        st.write("This is the Data View tab.")
+        st.dataframe(pd.DataFrame({'col': [1, 2, 3]}))
+    with tab2:
+        st.write("This is the Chart View tab.")
+        st.line_chart(get_dataset("tab_chart"))
+    st.subheader("Sidebar (`st.sidebar`)")
+    st.markdown("Elements placed in `st.sidebar` appear on the left sidebar.")
+    st.sidebar.write("---")
+    st.sidebar.subheader("Sidebar Content")
+    st.sidebar.text_input("Sidebar Input")
+    st.sidebar.button("Sidebar Button")
+    st.subheader("Forms (`st.form`)")
+    st.markdown("Group input widgets and submit them atomically.")
+    with st.form(key="my_form"):
+        st.write("Inside the form")
+        name = st.text_input("Name")
+        age = st.number_input("Age", min_value=0)
+        submitted = st.form_submit_button("Submit Form")
+        if submitted:
+            st.success(f"Form Submitted! Name: {name}, Age: {age}")
@@ -0,0 +1,27 @@
+"""Media Elements section of the demo app."""
+import streamlit as st
+from utils.media import media_url
+
+
+def render():
+    """Renders the Media Elements section."""
+    st.header("4. Media Elements")
+    st.write("Easily embed images, audio, and video into your Streamlit apps.")
+    st.subheader("Images (`st.image`)")
+    st.markdown("`st.image()`: Displays static images.")
+    st.image(media_url("streamlit_logo", width=200),
+        caption="Streamlit Logo from URL", width=200)
+    try:
+        st.image(media_url("picsum_400x200"), caption="Random Image from Picsum", use_column_width=True)
+    except Exception:
+        st.info("To display a local image, place an image file (e.g., 'local_image.jpg') in the same directory.")
+    st.subheader("Audio (`st.audio`)")
+    st.markdown("`st.audio()`: Embeds an audio player.")
+    audio_bytes = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    st.audio(audio_bytes, format="audio/wav", start_time=0)
+    st.info("Replace `audio_bytes` with actual audio data or a URL to play sound.")
+    st.audio(media_url("soundhelix_song_1"), format="audio/mp3", start_time=10)
+    st.subheader("Video (`st.video`)")
+    st.markdown("`st.video()`: Embeds a video player, supporting URLs including YouTube.")
+    st.video("http://www.youtube.com/watch?v=D0D4Pa22iG0", start_time=60, loop=True)
+    st.write("This is a Streamlit tutorial video, starting at 1 minute and looping.")
@@ -0,0 +1,94 @@
+"""Session State section of the demo app."""
+import streamlit as st
+from utils.datasets import get_dataset
+from utils.fragments import tracked_fragment
+from utils.paging import paged_dataframe
+from utils.session_store import SESSION_BYTE_CAP, large_values, session_summary
+
+def increment_counter():
+    """Callback function to increment session state counter."""
+    st.session_state.counter += 1
+
+def update_text_input():
+    """Callback function to update session state text."""
+    st.session_state.persisted_text = st.session_state.text_input_widget
+
+
+@tracked_fragment("counter")
+def counter_demo():
+    """The persisted counter and its buttons."""
+    st.subheader("Basic Session State Usage")
+    st.markdown("Initialize and update a counter that persists across interactions.")
+    if 'counter' not in st.session_state:
+        st.session_state.counter = 0
+    st.write(f"Current counter value: {st.session_state.counter}")
+    st.button("Increment Counter", on_click=increment_counter)
+    st.button("Reset Counter", on_click=lambda: st.session_state.update(counter=0))
+
+@tracked_fragment("persisted_text")
+def persisted_text_demo():
+    """The text input mirrored into `persisted_text`."""
+    st.subheader("Persisting Text Input")
+    st.markdown("Text input that remembers its value even after other interactions.")
+    if 'persisted_text' not in st.session_state:
+        st.session_state.persisted_text = ""
+    st.text_input(
+        "Type something here:",
+        key="text_input_widget", 
+        on_change=update_text_input,
+        value=st.session_state.persisted_text 
+    )
+    st.write(f"You typed (persisted): {st.session_state.persisted_text}")
+
+@tracked_fragment("my_slider_state")
+def slider_demo():
+    """A keyed slider read back from session state."""
+    st.subheader("Widget State Association")
+    st.markdown("Widgets with a `key` parameter automatically store their value in `st.session_state`.")
+    st.slider("Select a value (with key)", 0, 10, 5, key="my_slider_state")
+    st.write(f"Slider value from session state: {st.session_state.my_slider_state}")
+
+@tracked_fragment()
+def session_inspector():
+    """One row per session state key with its estimated size.
+
+    It tracks no keys, so the interactions above stay fragment reruns; the
+    table is current as of the last full rerun or "Refresh" click.
+    """
+    st.subheader("Inspecting Session State")
+    st.write("Each `st.session_state` key with its type and estimated size, largest first:")
+    st.button("Refresh", key="refresh_session_summary")
+    summary = session_summary().sort_values("bytes", ascending=False, ignore_index=True)
+    st.caption(f"This session holds about {summary['bytes'].sum():,} of {SESSION_BYTE_CAP:,} bytes.")
+    paged_dataframe(summary, key="session_summary", page_size=10)
+
+
+def large_value_demo():
+    """Keeps a large frame in the spillable session store."""
+    st.subheader("Large Values")
+    st.markdown(
+        "Large values go in a store that is spilled to disk when idle or when the "
+        "session goes over its byte cap, and is read back on the next access."
+    )
+    store = large_values()
+    col1, col2 = st.columns(2)
+    if col1.button("Store the large series"):
+        store.put("large_series", get_dataset("large_series"))
+    if col2.button("Drop it"):
+        store.pop("large_series")
+    if "large_series" in store:
+        locations = {key: location for key, _, location in store.rows()}
+        st.write(f"`large_series` is currently in **{locations['large_series']}**.")
+        if st.button("Load it"):
+            st.write(store.get("large_series").describe())
+
+
+def render():
+    """Renders the Session State section."""
+    st.header("7. Session State: Persisting User Interactions")
+    st.write("Session State allows you to maintain data across script reruns for a single user session.")
+    counter_demo()
+    persisted_text_demo()
+    slider_demo()
+    large_value_demo()
+    session_inspector()
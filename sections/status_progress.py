@@ -0,0 +1,43 @@
+"""Status & Progress section of the demo app."""
+import streamlit as st
+import time
+from utils.tasks import forget_task, start_task, task_status
+
+def simulate_operation(channel):
+    """Simulates a long operation that reports its progress."""
+    for percent_complete in range(100):
+        time.sleep(0.01)
+        channel.report((percent_complete + 1) / 100)
+
+def wait_for_results(channel):
+    """Simulates a slow call that gives no progress updates."""
+    time.sleep(3)
+    return "Done!"
+
+
+def render():
+    """Renders the Status & Progress section."""
+    st.header("9. Status and Progress Elements")
+    st.write("Provide feedback to users about ongoing processes.")
+    st.subheader("Progress Bar (`st.progress`)")
+    st.markdown("Displays a progress bar for long-running operations.")
+    progress_text = "Operation in progress. Please wait."
+    st.markdown("The work runs on a background worker, so the app stays responsive while the bar fills.")
+    progress_task = start_task("progress_demo_task", simulate_operation)
+    if task_status(progress_task, progress_text):
+        st.success("Operation complete!")
+    st.subheader("Spinner (`st.spinner`)")
+    st.markdown("Displays a spinner while a block of code is executing.")
+    spinner_task = start_task("spinner_demo_task", wait_for_results)
+    if task_status(spinner_task, 'Waiting for results...'):
+        st.success(spinner_task.result())
+    if st.button("Run Both Operations Again"):
+        forget_task("progress_demo_task")
+        forget_task("spinner_demo_task")
+        st.rerun()
+    st.subheader("Status Messages")
+    st.markdown("Provide quick feedback messages.")
+    st.success("This is a success message!")
+    st.info("This is an informational message.")
+    st.warning("This is a warning message.")
+    st.error("This is an error message!")
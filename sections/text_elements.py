@@ -0,0 +1,48 @@
+"""Text Elements section of the demo app."""
+import streamlit as st
+
+
+def render():
+    """Renders the Text Elements section."""
+    st.header("1. Text and Markdown Elements")
+    st.write("Streamlit offers diverse options for displaying textual content.")
+    st.subheader("Main Headings")
+    st.markdown("`st.title()`: The highest level heading for your app.")
+    st.title("App Title Example")
+    st.markdown("`st.header()`: A primary section heading.")
+    st.header("Section Header Example")
+    st.markdown("`st.subheader()`: A secondary section heading.")
+    st.subheader("Subsection Subheader Example")
+    st.subheader("Formatted Text")
+    st.markdown("`st.markdown()`: Renders text with **Markdown** formatting.")
+    st.markdown("This is a **bold** text, *italic* text, and `inline code`.")
+    st.markdown("(https://docs.streamlit.io/)")
+    st.markdown("`st.text()`: Displays raw, fixed-width text.")
+    st.text("This is preformatted text.\nIt respects line breaks.")
+    st.markdown("`st.caption()`: Displays text in a smaller font.")
+    st.caption("This is a small caption, often used for footnotes or descriptions.")
+    st.markdown("`st.code()`: Displays code blocks with syntax highlighting.")
+    st.code("""
+    import pandas as pd
+    import numpy as np
+    # Example Python code
+    def greet(name):
+      return f"Hello, {name}!"
+    """, language="python")
+    st.markdown("`st.latex()`: Renders mathematical expressions using LaTeX.")
+    st.latex(r"""
+    E=mc^2 \\
+    \int_0^1 x^2 dx = \frac{1}{3}
+    """)
+    st.markdown("`st.divider()`: Inserts a horizontal rule.")
+    st.divider()
+    st.write("Content below the divider.")
+    st.markdown("`st.badge()`: Displays a small, colored badge.")
+    st.info("[New Feature]", icon="✅")
+    st.warning("[Beta]", icon="⚠️")
+    st.subheader("Echoing Code")
+    st.markdown("`st.echo()`: Displays the code block before executing it. Useful for tutorials.")
+    with st.echo():
+        st.write("This line of code is displayed above.")
+        x = 10
+        st.write(f"The value of x is {x}.")
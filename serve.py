@@ -0,0 +1,164 @@
+"""Serves the demo from several Streamlit worker processes behind one port.
+
+A single Streamlit server runs every session's script on threads in one
+process, so CPU-bound sections (matplotlib renders, Styler computation, CSV
+parsing) contend for the GIL and the server cannot use more than one core.
+This launcher:
+
+* imports the sections and builds the shared resources (``warm_resource``
+  loaders such as ``load_expensive_model``, the Arrow frame cache) once in
+  the parent process;
+* forks ``--workers`` Streamlit servers on ``127.0.0.1:<base-port + i>``, so
+  every worker starts with those resources already built and shares their
+  memory copy-on-write;
+* runs a TCP proxy on ``--port`` with sticky affinity. A new browser is
+  assigned a worker round-robin, and the ``demo_worker`` cookie set on the
+  first response keeps its page, websocket and ``/media`` requests on that
+  worker, which holds the session.
+
+POSIX only (it relies on ``os.fork``). Run from the repository root::
+
+    python serve.py [--workers 4] [--port 8501] [--base-port 8600]
+
+``benchmarks/bench_load.py`` drives concurrent sessions against it.
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import re
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+COOKIE = "demo_worker"
+_COOKIE_RE = re.compile(rb"^cookie:.*\b" + COOKIE.encode() + rb"=(\d+)", re.I | re.M)
+WARM_MODULES = ("sections.caching",)
+
+
+def spawn_worker(port):
+    """Forks a Streamlit server for the demo on `port`; returns its pid."""
+    pid = os.fork()
+    if pid:
+        return pid
+    from streamlit.web import cli
+
+    code = 0
+    try:
+        cli.main([
+            "run", str(ROOT / "Streamlit.py"),
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            "--server.headless", "true",
+            "--server.fileWatcherType", "none",
+        ], prog_name="streamlit")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 0
+    finally:
+        os._exit(code)
+
+
+def wait_for_port(port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"worker on port {port} did not start")
+
+
+async def _pipe(reader, writer):
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+class StickyProxy:
+    """Forwards connections to worker ports, pinned by the worker cookie."""
+
+    def __init__(self, ports):
+        self.ports = ports
+        self._next = itertools.count()
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            client_writer.close()
+            return
+        match = _COOKIE_RE.search(head)
+        worker = int(match.group(1)) if match else None
+        assign = worker is None or worker >= len(self.ports)
+        if assign:
+            worker = next(self._next) % len(self.ports)
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", self.ports[worker])
+        except OSError:
+            client_writer.close()
+            return
+        upstream_writer.write(head)
+        # Forward the request body right away: the worker does not answer a
+        # request with a body until it has read it.
+        upload = asyncio.ensure_future(_pipe(client_reader, upstream_writer))
+        if assign:
+            try:
+                status = await upstream_reader.readuntil(b"\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                upload.cancel()
+                client_writer.close()
+                upstream_writer.close()
+                return
+            client_writer.write(status + f"Set-Cookie: {COOKIE}={worker}; Path=/; SameSite=Lax\r\n".encode())
+        await asyncio.gather(upload, _pipe(upstream_reader, client_writer))
+
+
+async def run_proxy(port, worker_ports):
+    proxy = StickyProxy(worker_ports)
+    server = await asyncio.start_server(proxy.handle, "0.0.0.0", port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--base-port", type=int, default=8600)
+    args = parser.parse_args()
+
+    from utils.prewarm import warm_now
+
+    warm_now(*WARM_MODULES)
+    worker_ports = [args.base_port + i for i in range(args.workers)]
+    pids = [spawn_worker(port) for port in worker_ports]
+    try:
+        for port in worker_ports:
+            wait_for_port(port)
+        print(f"Serving {args.workers} workers on http://localhost:{args.port}")
+        asyncio.run(run_proxy(args.port, worker_ports))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in pids:
+            os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
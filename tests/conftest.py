@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# AppTest scripts import the app's own packages.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
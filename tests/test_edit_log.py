@@ -0,0 +1,63 @@
+import json
+
+from streamlit.testing.v1 import AppTest
+
+
+def _editor_app():
+    import streamlit as st
+    from utils.datasets import shared_dataset
+    from utils.edit_log import logged_editor
+
+    log = logged_editor(shared_dataset("editable_df"), key="editor")
+    st.session_state["changes"] = list(log.changes)
+
+
+def _run_with_editor_state(at, state):
+    # AppTest cannot drive a data editor, so send its widget state the way
+    # the browser does: as JSON under the editor's widget id.
+    states = at._tree.get_widget_states()
+    widget = states.widgets.add()
+    widget.id = at.dataframe[0].proto.id
+    widget.string_value = json.dumps(state)
+    return at._run(states)
+
+
+def test_edit_is_reported_once():
+    at = AppTest.from_function(_editor_app).run()
+    state = {"edited_rows": {"0": {"Column A": 10}}, "added_rows": [], "deleted_rows": []}
+
+    _run_with_editor_state(at, state)
+    assert not at.exception
+    assert at.session_state["changes"] == [("edit", 0, "Column A", 10)]
+
+    _run_with_editor_state(at, state)
+    assert not at.exception
+    assert at.session_state["changes"] == []
+
+
+def test_deletes_and_additions():
+    at = AppTest.from_function(_editor_app).run()
+    state = {"edited_rows": {}, "added_rows": [{"Column A": 4}], "deleted_rows": [1]}
+
+    _run_with_editor_state(at, state)
+    assert at.session_state["changes"] == [("delete", 1, None, None), ("add", 0, None, {"Column A": 4})]
+
+    _run_with_editor_state(at, {"edited_rows": {}, "added_rows": [], "deleted_rows": []})
+    assert at.session_state["changes"] == [("restore", 1, None, None), ("remove", 0, None, None)]
+
+
+def test_cell_edits_patch_the_assembled_frame():
+    from utils.datasets import shared_dataset
+    from utils.edit_log import EditLog
+
+    def state(cells):
+        return {"edited_rows": cells, "added_rows": [{"Column A": 4}], "deleted_rows": [0]}
+
+    log = EditLog(shared_dataset("editable_df"))
+    log.sync(state({}))
+    frame, version = log.frame(), log.version
+
+    log.sync(state({"2": {"Column B": "W"}}))
+    assert log.frame() is frame
+    assert log.version != version
+    assert list(log.frame()["Column B"].iloc[:2]) == ["Y", "W"]
@@ -0,0 +1,107 @@
+import json
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from streamlit.testing.v1 import AppTest
+
+import utils.paging
+from utils.paging import _matching_rows, _sorted_rows, _window
+
+FRAME = pd.DataFrame({
+    "name": ["b", None, "a", "c"],
+    "value": [2.0, np.nan, 1.0, 3.0],
+})
+
+
+def test_sort_puts_missing_values_last():
+    for data in (FRAME, pa.Table.from_pandas(FRAME)):
+        for column in ("name", "value"):
+            assert list(_sorted_rows(data, None, column, False)) == [2, 0, 3, 1]
+            assert list(_sorted_rows(data, None, column, True)) == [3, 0, 2, 1]
+
+
+def test_sort_mixed_object_column():
+    data = pd.DataFrame({"mixed": pd.Series(["x", 1, None, 2.5], dtype=object)})
+    assert list(_sorted_rows(data, None, "mixed", False)) == [1, 3, 0, 2]
+
+
+def test_sort_filtered_rows():
+    rows = np.array([0, 2, 3])
+    assert list(_sorted_rows(FRAME, rows, "value", True)) == [3, 0, 2]
+
+
+def test_filter():
+    for data in (FRAME, pa.Table.from_pandas(FRAME)):
+        assert list(_matching_rows(data, "A")) == [2]
+        assert list(_matching_rows(data, "3")) == [3]
+
+
+def test_arrow_windows_stay_arrow():
+    table = pa.Table.from_pandas(FRAME)
+    window = _window(table, None, 1, 3)
+    assert isinstance(window, pa.Table)
+    assert window.column("value").chunk(0).buffers()[1].address == table.column("value").chunk(0).buffers()[1].address
+    assert _window(table, np.array([3, 0]), 0, 2).column("name").to_pylist() == ["c", "b"]
+
+
+def _paged_app():
+    import streamlit as st
+    from utils.paging import paged_dataframe
+
+    st.session_state["selected"] = list(paged_dataframe(
+        st.session_state["data"], key="paged", page_size=2,
+        on_select="rerun", selection_mode="single-row",
+    ))
+
+
+def _paged(values):
+    at = AppTest.from_function(_paged_app)
+    at.session_state["data"] = pd.DataFrame({"x": values})
+    return at.run()
+
+
+def _shown(at):
+    return list(at.dataframe[0].value["x"])
+
+
+def test_sorted_view_follows_data_changes():
+    at = _paged([3, 1, 2])
+    at.selectbox(key="paged_sort").set_value("x")
+    at.number_input(key="paged_page").set_value(2)
+    at.run()
+    assert _shown(at) == [3]
+
+    at.session_state["data"] = pd.DataFrame({"x": [1, 3, 2]})
+    at.number_input(key="paged_page").set_value(1)
+    at.run()
+    assert _shown(at) == [1, 2]
+
+
+def test_selection_maps_to_data_positions():
+    at = _paged([5, 9, 7, 8, 6])
+    at.selectbox(key="paged_sort").set_value("x")
+    at.toggle(key="paged_descending").set_value(True)
+    at.number_input(key="paged_page").set_value(2)
+    at.run()
+    assert _shown(at) == [7, 6]
+
+    # AppTest cannot click a row, so send the selection the way the browser
+    # does: as JSON under the dataframe's widget id.
+    states = at._tree.get_widget_states()
+    widget = states.widgets.add()
+    widget.id = at.dataframe[0].proto.id
+    widget.string_value = json.dumps({"selection": {"rows": [1], "columns": []}})
+    at._run(states)
+    assert not at.exception
+    assert at.session_state["selected"] == [4]
+
+
+def test_unsorted_view_does_not_hash_the_data():
+    with mock.patch.object(utils.paging, "_fingerprint", side_effect=AssertionError("hashed")):
+        at = _paged([3, 1, 2])
+        at.number_input(key="paged_page").set_value(2)
+        at.run()
+    assert not at.exception
+    assert _shown(at) == [2]
@@ -0,0 +1,202 @@
+"""Reuse of Arrow IPC bytes for frames that are displayed unchanged.
+
+Every ``st.dataframe``, ``st.table``, chart and ``st.write(frame)`` call
+serializes its data to Arrow IPC bytes on every rerun, even when the frame
+has not changed. ``install()`` wraps Streamlit's two serializers with a
+byte-bounded LRU of the IPC buffers:
+
+* ``pyarrow.Table`` (and slices of it) is keyed by identity: the addresses of
+  its immutable buffers plus offset and length. The cache entry keeps the
+  table alive, so those addresses cannot be reused for other data, and the
+  table's buffers count toward the byte budget. Only tables memory-mapped
+  with ``arrow_table()`` are cached: they are never copied or converted to
+  pandas, and pinning them costs page cache rather than heap. Tables built
+  per rerun would only fill the cache.
+* A pandas ``DataFrame`` is keyed by a content hash: shape, column and index
+  labels, names and dtypes, and a BLAKE2 digest of the column buffers, which
+  is cheaper than the conversion. Frames with object or string columns,
+  where hashing costs more than converting, are passed through.
+
+Hits, the IPC bytes reused and the conversion time saved are added to the
+rerun profile's counters (see ``utils.profiler``) and to ``stats()``.
+"""
+import collections
+import functools
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from streamlit import dataframe_util
+
+from utils.profiler import count
+
+MAX_BYTES = 128 * 1024 * 1024
+
+_lock = threading.Lock()
+_local = threading.local()
+_entries = collections.OrderedDict()
+_total_bytes = 0
+_stats = collections.Counter()
+_installed = False
+# (address, size) of the files mapped by ``arrow_table()``.
+_mapped_ranges = set()
+
+
+def _table_key(table):
+    chunks = tuple(
+        (chunk.offset, len(chunk),
+         tuple((buf.address, buf.size) if buf is not None else None for buf in chunk.buffers()))
+        for column in table.columns
+        for chunk in column.chunks
+    )
+    return ("table", table.schema, table.num_rows, chunks)
+
+
+def _is_mapped(table):
+    with _lock:
+        ranges = list(_mapped_ranges)
+    return all(
+        any(start <= buf.address and buf.address + buf.size <= start + size for start, size in ranges)
+        for column in table.columns
+        for chunk in column.chunks
+        for buf in chunk.buffers()
+        if buf is not None and buf.size
+    )
+
+
+def _table_cache_key(table):
+    return _table_key(table) if _is_mapped(table) else None
+
+
+def _frame_key(df, downcast_large_types):
+    import numpy as np
+
+    digest = hashlib.blake2b(digest_size=16)
+
+    def update(values):
+        # Only plain numeric/datetime numpy data hashes faster than it converts.
+        if not isinstance(values.dtype, np.dtype) or values.dtype.kind not in "biufmM":
+            return False
+        digest.update(np.ascontiguousarray(values.to_numpy()).view(np.uint8))
+        return True
+
+    if not all(update(column) for _, column in df.items()):
+        return None
+    index = df.index
+    if type(index).__name__ == "RangeIndex":
+        index_key = (index.start, index.stop, index.step)
+    elif update(index):
+        index_key = None
+    else:
+        return None
+    # repr() keeps labels such as 1 and "1" apart.
+    return ("frame", df.shape, tuple(map(repr, df.columns)), repr(list(df.columns.names)),
+            repr(list(index.names)), str(index.dtype), tuple(map(str, df.dtypes)),
+            downcast_large_types, index_key, digest.hexdigest())
+
+
+def _lookup(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(key)
+        data, seconds, _, _ = entry
+        _stats["hits"] += 1
+        _stats["bytes_reused"] += len(data)
+        _stats["seconds_saved"] += seconds
+    count("arrow_cache_hits")
+    count("arrow_kb_reused", len(data) / 1024)
+    count("arrow_ms_saved", seconds * 1000)
+    return data
+
+
+def _store(key, data, seconds, keep_alive):
+    global _total_bytes
+    # A pinned table is kept alive by the entry, so its buffers count too.
+    size = len(data) + (keep_alive.get_total_buffer_size() if keep_alive is not None else 0)
+    if size > MAX_BYTES:
+        return
+    with _lock:
+        if key in _entries:
+            return
+        _entries[key] = (data, seconds, keep_alive, size)
+        _total_bytes += size
+        while _total_bytes > MAX_BYTES:
+            _, (_, _, _, evicted) = _entries.popitem(last=False)
+            _total_bytes -= evicted
+
+
+def _cached(convert, make_key):
+    @functools.wraps(convert)
+    def wrapper(data, *args, **kwargs):
+        # The pandas serializer calls the table serializer on a fresh
+        # table; only the outermost call is cached.
+        if getattr(_local, "busy", False):
+            return convert(data, *args, **kwargs)
+        _local.busy = True
+        try:
+            key = make_key(data, *args, **kwargs)
+            if key is None:
+                return convert(data, *args, **kwargs)
+            cached = _lookup(key)
+            if cached is not None:
+                return cached
+            start = time.perf_counter()
+            result = convert(data, *args, **kwargs)
+            seconds = time.perf_counter() - start
+        finally:
+            _local.busy = False
+        _store(key, result, seconds, data if key[0] == "table" else None)
+        return result
+    return wrapper
+
+
+def install():
+    """Wraps Streamlit's Arrow serializers once per process."""
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        dataframe_util.convert_arrow_table_to_arrow_bytes = _cached(
+            dataframe_util.convert_arrow_table_to_arrow_bytes, _table_cache_key
+        )
+        dataframe_util.convert_pandas_df_to_arrow_bytes = _cached(
+            dataframe_util.convert_pandas_df_to_arrow_bytes,
+            lambda df, downcast_large_types=False: _frame_key(df, downcast_large_types),
+        )
+        _installed = True
+
+
+@functools.lru_cache(maxsize=32)
+def _mapped_table(path, mtime, size):
+    import pyarrow as pa
+
+    # Reading through one buffer over the whole mapping keeps the table's
+    # buffers inside a known address range (see ``_is_mapped``).
+    mapped = pa.memory_map(path).read_buffer()
+    with _lock:
+        _mapped_ranges.add((mapped.address, mapped.size))
+    try:
+        return pa.ipc.open_file(mapped).read_all()
+    except pa.ArrowInvalid:
+        return pa.ipc.open_stream(mapped).read_all()
+
+
+def arrow_table(path):
+    """Returns the Arrow IPC / Feather v2 file at `path` as a memory-mapped table.
+
+    The table is shared and reused until the file changes; its columns point
+    into the mapped file, so nothing is read or copied up front. Pass it to
+    ``st.dataframe``, a chart or ``paged_dataframe`` as is.
+    """
+    stat = Path(path).stat()
+    return _mapped_table(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def stats():
+    """Returns process-wide hit/miss counts, bytes reused and time saved."""
+    with _lock:
+        return {**_stats, "entries": len(_entries), "cached_bytes": _total_bytes}
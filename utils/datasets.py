@@ -0,0 +1,172 @@
+"""Seeded sample datasets shared by the demo sections.
+
+Builders are registered under a name and a version and are built at most once
+per ``(name, version, seed)`` through ``st.cache_data``, so every rerun and
+every session gets identical frames instead of fresh ``np.random`` output.
+``shared_dataset()`` returns one read-only instance instead of a copy.
+Identical frames serialize to identical element messages, which lets
+Streamlit's ForwardMsg cache send the browser a reference to an element it
+already holds instead of the full payload (see ``.streamlit/config.toml``).
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from utils.arrow_cache import arrow_table
+
+_BUILDERS = {}
+DATASET_DIR = Path(__file__).resolve().parent.parent / ".streamlit" / "datasets"
+
+
+def dataset(name, version=1):
+    """Registers a builder ``fn(rng) -> DataFrame`` as dataset `name`.
+
+    Bump `version` whenever a builder changes so cached copies of the old
+    output are not reused.
+    """
+    def decorator(fn):
+        _BUILDERS[name] = (version, fn)
+        return fn
+    return decorator
+
+
+@st.cache_data(show_spinner=False)
+def _build(name, version, seed):
+    return _BUILDERS[name][1](np.random.default_rng(seed))
+
+
+def get_dataset(name, seed=0):
+    """Returns dataset `name`, built once per registered version and seed."""
+    version, _ = _BUILDERS[name]
+    return _build(name, version, seed)
+
+
+@st.cache_resource(show_spinner=False)
+def _shared(name, version, seed):
+    return _build(name, version, seed)
+
+
+def dataset_key(name, seed=0):
+    """Returns ``(name, version, seed)``, a hashable key for dataset `name`."""
+    version, _ = _BUILDERS[name]
+    return name, version, seed
+
+
+def shared_dataset(name, seed=0):
+    """Returns dataset `name` as one frame shared by every rerun and session.
+
+    Unlike ``get_dataset()``, which hands out a fresh copy on every call,
+    this returns the same object each time, so callers can key state on its
+    identity and large frames are not unpickled on every rerun. The frame
+    must be treated as read-only.
+    """
+    version, _ = _BUILDERS[name]
+    return _shared(name, version, seed)
+
+
+def dataset_table(name, seed=0):
+    """Returns dataset `name` as a memory-mapped ``pyarrow.Table``.
+
+    The frame is written once to an uncompressed Feather file under
+    ``.streamlit/datasets``; later calls (and restarts) map that file, with
+    no pandas round-trip.
+    """
+    from pyarrow import feather
+
+    version, _ = _BUILDERS[name]
+    path = DATASET_DIR / f"{name}-v{version}-s{seed}.feather"
+    if not path.exists():
+        DATASET_DIR.mkdir(parents=True, exist_ok=True)
+        # A unique temporary name, so concurrent sessions never write into
+        # the same file.
+        fd, tmp = tempfile.mkstemp(dir=DATASET_DIR, suffix=".part")
+        os.close(fd)
+        try:
+            feather.write_feather(get_dataset(name, seed), tmp, compression="uncompressed")
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return arrow_table(path)
+
+
+@dataset("data_for_df")
+def _data_for_df(rng):
+    return pd.DataFrame(
+        rng.standard_normal((10, 5)),
+        columns=[f'Col {i+1}' for i in range(5)]
+    )
+
+
+@dataset("styled_df")
+def _styled_df(rng):
+    return pd.DataFrame(
+        rng.random((5, 3)),
+        columns=[f"A{i+1}" for i in range(3)]
+    )
+
+
+@dataset("initial_rows")
+def _initial_rows(rng):
+    return pd.DataFrame(rng.random((3, 2)), columns=['X', 'Y'])
+
+
+@dataset("chart_data")
+def _chart_data(rng):
+    return pd.DataFrame(
+        rng.standard_normal((20, 3)),
+        columns=['a', 'b', 'c']
+    )
+
+
+@dataset("map_data")
+def _map_data(rng):
+    return pd.DataFrame(
+        rng.standard_normal((100, 2)) + [37.76, -122.4],
+        columns=['lat', 'lon']
+    )
+
+
+@dataset("large_series")
+def _large_series(rng):
+    return pd.DataFrame(
+        rng.standard_normal((200_000, 3)).cumsum(axis=0),
+        columns=['a', 'b', 'c']
+    )
+
+
+@dataset("large_map_data")
+def _large_map_data(rng):
+    return pd.DataFrame(
+        rng.standard_normal((1_000_000, 2)) * 0.5 + [37.76, -122.4],
+        columns=['lat', 'lon']
+    )
+
+
+@dataset("histogram_values")
+def _histogram_values(rng):
+    return pd.DataFrame({"value": rng.standard_normal(100)})
+
+
+@dataset("tab_chart")
+def _tab_chart(rng):
+    return pd.DataFrame(rng.standard_normal((10, 1)), columns=['value'])
+
+
+@dataset("editable_df")
+def _editable_df(rng):
+    return pd.DataFrame(
+        {"Column A": [1, 2, 3], "Column B": ["X", "Y", "Z"]}
+    )
+
+
+@dataset("editable_large")
+def _editable_large(rng):
+    return pd.DataFrame({
+        "Column A": rng.integers(0, 100, 100_000),
+        "Column B": rng.choice(["X", "Y", "Z"], 100_000)
+    })
@@ -0,0 +1,213 @@
+"""Two-tier cache for functions that return DataFrames.
+
+``st.cache_data`` keeps entries in process memory only, so every restart or
+replica recomputes them, and entries are not bounded by size. ``FrameCache``
+keeps a byte-bounded in-memory LRU in front of an on-disk store of Arrow IPC
+files. A disk hit reads the file through a memory map and converts it to
+pandas once, which is far cheaper than recomputing it, and ``warm()``
+preloads existing files at startup. Disk reads happen outside the cache's
+lock, so a cold load never delays memory hits for other keys.
+
+Frames returned from the cache are shared between callers; treat them as
+read-only.
+"""
+import collections
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import pyarrow as pa
+
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / ".streamlit" / "frame_cache"
+
+
+class FrameCache:
+    """A memory LRU bounded by `max_bytes` over Arrow files in `directory`.
+
+    `directory` defaults to ``DEFAULT_DIR`` as set when the cache is created.
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024, ttl=None):
+        self.directory = Path(directory or DEFAULT_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._memory = collections.OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = weakref.WeakValueDictionary()
+        self._stats = collections.Counter()
+
+    def _path(self, key):
+        return self.directory / f"{key}.arrow"
+
+    def _expired(self, created):
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _remember(self, key, frame, created):
+        nbytes = int(frame.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        self._memory[key] = (frame, nbytes, created)
+        self._memory_bytes += nbytes
+        while self._memory_bytes > self.max_bytes:
+            _, (_, evicted_bytes, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_bytes
+            self._stats["evictions"] += 1
+
+    def _load(self, path):
+        # A truncated or corrupt file (e.g. from a crash mid-write on a
+        # filesystem without atomic rename) is dropped and counted as a miss.
+        try:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        except FileNotFoundError:
+            # Removed by clear() or expiry since it was listed.
+            return None
+        except pa.ArrowInvalid:
+            path.unlink(missing_ok=True)
+            return None
+        return table.to_pandas(split_blocks=True)
+
+    def key_lock(self, key):
+        """Returns the lock that serializes computing the entry for `key`."""
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def get(self, key):
+        """Returns the cached frame for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[2]):
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return entry[0]
+        path = self._path(key)
+        try:
+            created = path.stat().st_mtime
+        except FileNotFoundError:
+            created = None
+        if created is not None and not self._expired(created):
+            frame = self._load(path)
+            if frame is not None:
+                with self._lock:
+                    self._remember(key, frame, created)
+                    self._stats["disk_hits"] += 1
+                return frame
+        elif created is not None:
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, key, frame):
+        """Stores `frame` in both tiers."""
+        table = pa.Table.from_pandas(frame)
+        # A unique temporary name, so concurrent writers of the same key
+        # never write into the same file.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        os.close(fd)
+        try:
+            with pa.OSFile(tmp, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self._lock:
+            self._remember(key, frame, time.time())
+
+    def warm(self):
+        """Loads the newest unexpired disk entries until memory is full."""
+        stats = []
+        for path in self.directory.glob("*.arrow"):
+            try:
+                stats.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        for path, stat in sorted(stats, key=lambda item: item[1].st_mtime, reverse=True):
+            with self._lock:
+                if self._expired(stat.st_mtime) or path.stem in self._memory:
+                    continue
+                if self._memory_bytes + stat.st_size > self.max_bytes:
+                    break
+            frame = self._load(path)
+            if frame is not None:
+                with self._lock:
+                    if path.stem not in self._memory:
+                        self._remember(path.stem, frame, stat.st_mtime)
+
+    def clear(self, prefix=""):
+        """Removes entries whose key starts with `prefix` from both tiers."""
+        with self._lock:
+            for key in [key for key in self._memory if key.startswith(prefix)]:
+                self._memory_bytes -= self._memory.pop(key)[1]
+            for path in self.directory.glob(f"{prefix}*.arrow"):
+                path.unlink(missing_ok=True)
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and current memory usage."""
+        with self._lock:
+            return {
+                "memory_hits": self._stats["memory_hits"],
+                "disk_hits": self._stats["disk_hits"],
+                "misses": self._stats["misses"],
+                "evictions": self._stats["evictions"],
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+def _function_key(func):
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+    digest = hashlib.sha256(source.encode()).hexdigest()[:12]
+    return f"{func.__module__}.{func.__qualname__}-{digest}"
+
+
+def frame_cached(cache):
+    """Decorator caching a DataFrame-returning function in `cache`.
+
+    The key covers the function's source and the `repr` of its arguments.
+    Concurrent misses on the same key call the function once; the other
+    callers wait for its result.
+    The wrapper gains ``clear()``, which empties both tiers for this
+    function, and a ``cache`` attribute.
+    """
+    def decorator(func):
+        name = _function_key(func)
+
+        def wrapper(*args, **kwargs):
+            call = repr((args, sorted(kwargs.items())))
+            key = f"{name}-{hashlib.sha256(call.encode()).hexdigest()[:16]}"
+            frame = cache.get(key)
+            if frame is not None:
+                return frame
+            with cache.key_lock(key):
+                frame = cache.get(key)
+                if frame is None:
+                    frame = func(*args, **kwargs)
+                    cache.put(key, frame)
+            return frame
+
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.cache = cache
+        wrapper.clear = lambda: cache.clear(f"{name.rsplit('-', 1)[0]}-")
+        return wrapper
+    return decorator
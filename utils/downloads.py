@@ -0,0 +1,60 @@
+"""Deferred, chunked payloads for ``st.download_button``.
+
+Passing bytes to ``data=`` builds the payload on every rerun and keeps it in
+the session's media storage even if nobody downloads it. ``deferred()`` wraps
+a chunk generator in a callable instead; Streamlit only calls it when the
+user clicks the button, and the chunks are pulled through a file-like reader.
+"""
+import io
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterable of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # Consumers rewind before reading; that is only a no-op at the start.
+        target = self._pos + offset if whence == io.SEEK_CUR else offset
+        if whence not in (io.SEEK_SET, io.SEEK_CUR) or target != self._pos:
+            raise io.UnsupportedOperation("ChunkReader is forward-only")
+        return self._pos
+
+    def readinto(self, b):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        self._pos += n
+        return n
+
+
+def iter_bytes(data, chunk_size=CHUNK_SIZE):
+    """Yields `data` in slices of at most `chunk_size` bytes."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield bytes(view[start:start + chunk_size])
+
+
+def deferred(make_chunks, *args, **kwargs):
+    """Returns a ``download_button`` data callable that streams `make_chunks`.
+
+    `make_chunks(*args, **kwargs)` must return an iterable of bytes; it is
+    not called until the download is requested.
+    """
+    return lambda: ChunkReader(make_chunks(*args, **kwargs))
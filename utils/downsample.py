@@ -0,0 +1,91 @@
+"""Server-side downsampling for native line/area/bar/scatter charts.
+
+The native chart commands serialize every point into the chart's Arrow
+payload. ``downsampled_chart()`` sends at most about ``max_points`` rows
+instead:
+
+* line, area and bar charts split the rows into consecutive buckets and keep
+  the rows holding each series' minimum and maximum in every bucket, so
+  peaks and troughs survive;
+* scatter charts keep one point per cell of a grid over the x/y range.
+
+Both run as whole-array NumPy operations. A zoom slider picks a row range;
+zooming re-runs the downsampling on that range, so detail increases as the
+window shrinks until the raw points are shown.
+"""
+import math
+
+import streamlit as st
+import numpy as np
+
+MAX_POINTS = 2000
+
+
+def minmax_rows(values, buckets):
+    """Returns sorted row positions holding each column's min/max per bucket.
+
+    `values` is a 2-D float array with rows in x order.
+    """
+    n = len(values)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    size = math.ceil(n / buckets)
+    padded = np.full((size * math.ceil(n / size), values.shape[1]), np.nan)
+    padded[:n] = values
+    grid = padded.reshape(-1, size, values.shape[1])
+    offsets = np.arange(grid.shape[0])[:, None] * size
+    low = np.argmin(np.where(np.isnan(grid), np.inf, grid), axis=1) + offsets
+    high = np.argmax(np.where(np.isnan(grid), -np.inf, grid), axis=1) + offsets
+    rows = np.concatenate([[0, n - 1], low.ravel(), high.ravel()])
+    return np.unique(rows[rows < n])
+
+
+def grid_rows(x, y, width, height):
+    """Returns row positions keeping one point per cell of a `width` x `height` grid."""
+    def cells(values, count):
+        lo, hi = np.nanmin(values), np.nanmax(values)
+        scaled = (values - lo) / (hi - lo) if hi > lo else np.zeros_like(values)
+        return np.clip((scaled * count).astype(np.int64), 0, count - 1)
+
+    cell = cells(x, width) * height + cells(y, height)
+    _, rows = np.unique(cell, return_index=True)
+    return np.sort(rows)
+
+
+def downsample(data, max_points=MAX_POINTS, x=None, y=None):
+    """Returns `data` reduced to at most about `max_points` rows."""
+    if len(data) <= max_points:
+        return data
+    if x is not None:
+        side = int(math.sqrt(max_points))
+        xs = data[x].to_numpy(dtype=float)
+        ys = data[y].to_numpy(dtype=float)
+        return data.iloc[grid_rows(xs, ys, side, side)]
+    numeric = data.select_dtypes("number").to_numpy(dtype=float)
+    # Every kept row carries all series, so split the budget between them.
+    buckets = max(1, max_points // (2 * numeric.shape[1]))
+    return data.iloc[minmax_rows(numeric, buckets)]
+
+
+def downsampled_chart(kind, data, key, max_points=MAX_POINTS, **kwargs):
+    """Draws ``st.<kind>`` for `data`, downsampled to about `max_points` points.
+
+    `kind` is "line_chart", "area_chart", "bar_chart" or "scatter_chart";
+    remaining keyword arguments are passed to it. Scatter charts need `x` and
+    `y`. A zoom slider is shown when `data` has more than `max_points` rows.
+    """
+    total = len(data)
+    window = data
+    if total > max_points:
+        start, stop = st.slider(
+            "Zoom (row range)", 0, total, (0, total), key=f"{key}_zoom"
+        )
+        window = data.iloc[start:max(stop, start + 1)]
+    if kind == "scatter_chart":
+        points = downsample(window, max_points, x=kwargs["x"], y=kwargs["y"])
+    else:
+        points = downsample(window, max_points)
+    element = getattr(st, kind)(points, **kwargs)
+    if len(points) < len(window):
+        st.caption(f"Showing {len(points):,} of {len(window):,} points.")
+    return element
@@ -0,0 +1,137 @@
+"""Edit-log syncing for ``st.data_editor``.
+
+The browser already reports data editor edits as deltas: the widget state
+under its key holds ``edited_rows``, ``added_rows`` and ``deleted_rows``,
+relative to the frame that was passed in. ``logged_editor()`` keeps that base
+frame fixed across reruns (so its payload is served from the ForwardMsg cache
+instead of being re-sent) and returns an ``EditLog``. On every run the log
+diffs the widget state against what it has already applied and exposes only
+the new deltas as ``changes``. A working copy of the edited frame is built
+the first time ``frame()`` is called and from then on is patched in place,
+so a cell edit on a 100k-row table costs one cell assignment. The frame with
+deletions and additions applied is cached as well and rebuilt only when rows
+are deleted, restored, added or removed; ``version`` changes with it, so
+callers can key derived state on it instead of hashing the frame.
+"""
+import bisect
+import itertools
+
+import streamlit as st
+import pandas as pd
+
+_MISSING = object()
+_CELL_KINDS = ("edit", "revert")
+_versions = itertools.count()
+
+
+def _coerce(value, dtype):
+    if value is None:
+        return None
+    try:
+        return pd.Series([value]).astype(dtype).iloc[0]
+    except (TypeError, ValueError):
+        return value
+
+
+class EditLog:
+    """A base frame and the editor deltas applied to it so far."""
+
+    def __init__(self, base):
+        self.base = base
+        self.changes = []
+        self._cells = {}
+        self._added = []
+        self._deleted = set()
+        self._work = None
+        self._frame = None
+        self.version = next(_versions)
+
+    def sync(self, state):
+        """Applies the deltas in `state` that are new since the last sync.
+
+        Returns the list of ``(kind, row, column, value)`` changes, where kind
+        is ``"edit"``, ``"revert"``, ``"delete"``, ``"restore"``, ``"add"`` or
+        ``"remove"``. Rows are positions in the base frame, or in the added
+        rows for ``"add"`` and ``"remove"``.
+        """
+        changes = []
+        cells = {
+            (int(row), column): value
+            for row, edits in state.get("edited_rows", {}).items()
+            for column, value in edits.items()
+        }
+        for cell, value in cells.items():
+            if self._cells.get(cell, _MISSING) != value:
+                changes.append(("edit", *cell, value))
+        for cell in self._cells.keys() - cells.keys():
+            changes.append(("revert", *cell, None))
+        deleted = set(state.get("deleted_rows", []))
+        changes += [("delete", row, None, None) for row in sorted(deleted - self._deleted)]
+        changes += [("restore", row, None, None) for row in sorted(self._deleted - deleted)]
+        added = list(state.get("added_rows", []))
+        for i, row in enumerate(added):
+            if i >= len(self._added) or self._added[i] != row:
+                changes.append(("add", i, None, row))
+        changes += [("remove", i, None, None) for i in range(len(added), len(self._added))]
+
+        self._cells, self._deleted, self._added = cells, deleted, added
+        if self._work is not None:
+            self._apply(self._work, changes)
+        if any(kind not in _CELL_KINDS for kind, *_ in changes):
+            self._frame = None
+        elif self._frame is not None and self._frame is not self._work:
+            self._apply(self._frame, changes, self._deleted)
+        if changes:
+            self.version = next(_versions)
+        self.changes = changes
+        return changes
+
+    def _apply(self, frame, changes, deleted=()):
+        # `frame` holds the base rows minus `deleted`, so a base row moves up
+        # by the number of deleted rows before it.
+        skipped = sorted(deleted)
+        for kind, row, column, value in changes:
+            if kind not in _CELL_KINDS or row in deleted:
+                continue
+            pos = row - bisect.bisect_left(skipped, row)
+            col = frame.columns.get_loc(column)
+            if kind == "edit":
+                frame.iat[pos, col] = _coerce(value, frame.dtypes.iloc[col])
+            else:
+                frame.iat[pos, col] = self.base.iat[row, self.base.columns.get_loc(column)]
+
+    def frame(self):
+        """Returns the edited frame: base rows with edits, minus deletions, plus additions."""
+        if self._work is None:
+            self._work = self.base.copy()
+            self._apply(self._work, [("edit", *cell, value) for cell, value in self._cells.items()])
+        if self._frame is None:
+            frame = self._work
+            if self._deleted:
+                frame = frame.drop(index=frame.index[sorted(self._deleted)])
+            if self._added:
+                added = pd.DataFrame(self._added, columns=frame.columns)
+                frame = pd.concat([frame, added.astype(frame.dtypes, errors="ignore")], ignore_index=True)
+            self._frame = frame
+        return self._frame
+
+    def summary(self):
+        """Returns counts of the edited cells, deleted rows and added rows."""
+        return {"edited cells": len(self._cells), "deleted rows": len(self._deleted), "added rows": len(self._added)}
+
+
+def logged_editor(base, key, **kwargs):
+    """Shows `base` in ``st.data_editor`` and returns its synced ``EditLog``.
+
+    `base` must be the same object on every rerun (e.g. from
+    ``utils.datasets.shared_dataset``); passing a different frame starts a
+    new log. ``get_dataset`` returns a new copy on every call and would reset
+    the log on each rerun. Extra keyword arguments are passed to ``st.data_editor``.
+    """
+    log_key = f"_{key}_log"
+    log = st.session_state.get(log_key)
+    if log is None or log.base is not base:
+        log = st.session_state[log_key] = EditLog(base)
+    st.data_editor(base, key=key, **kwargs)
+    log.sync(st.session_state[key])
+    return log
@@ -0,0 +1,69 @@
+"""Fragments with dependency tracking on ``st.session_state`` keys.
+
+``st.fragment`` lets a widget rerun only the function it lives in, but a
+fragment rerun never refreshes other fragments, so one that displays a key
+changed elsewhere would go stale. ``tracked_fragment(*keys)`` records the
+values of the keys a fragment depends on each time it renders. When a
+fragment-scoped rerun leaves any other fragment's keys changed, the rerun is
+promoted to a full app rerun; otherwise only the fragment re-executes.
+
+Keys are compared by value, so replace tracked values instead of mutating
+them in place.
+"""
+import functools
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.profiler import span
+
+_SNAPSHOTS = "_fragment_snapshots"
+_MISSING = object()
+
+
+def _values(keys):
+    return {key: st.session_state.get(key, _MISSING) for key in keys}
+
+
+def _changed(seen):
+    for key, value in seen.items():
+        current = st.session_state.get(key, _MISSING)
+        if current is value:
+            continue
+        try:
+            if bool(current != value):
+                return True
+        except (TypeError, ValueError):
+            return True
+    return False
+
+
+def _is_fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+def reset_fragment_tracking():
+    """Forgets recorded fragments; call at the top of every full script run."""
+    st.session_state[_SNAPSHOTS] = {}
+
+
+def tracked_fragment(*depends_on):
+    """Decorator turning a function into a fragment that depends on `depends_on`."""
+    def decorator(fn):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        @st.fragment
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(f"fragment: {fn.__name__}"):
+                result = fn(*args, **kwargs)
+            snapshots = st.session_state.setdefault(_SNAPSHOTS, {})
+            snapshots[name] = _values(depends_on)
+            if _is_fragment_rerun() and any(
+                _changed(seen) for other, seen in snapshots.items() if other != name
+            ):
+                st.rerun()
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,143 @@
+"""Grid-clustered ``st.map`` rendering for large point sets.
+
+``st.map(df)`` sends every row to the browser on every rerun. ``GridIndex``
+quantizes each point once onto a quadtree-style grid over the data's bounding
+box (level ``l`` has ``2**l`` cells per axis) and aggregates cells per level
+on first use, keeping the most recently used levels up to
+``LEVEL_CACHE_BYTES``. ``clustered_map()`` then sends only the cells inside the chosen
+viewport, at the finest level that keeps them under ``max_points``, and falls
+back to the raw points once few enough are visible. The index is built once
+per dataset and shared through ``st.cache_resource``, keyed on a hash of the
+frame or, for large shared frames, on a caller-supplied ``source`` key so
+the frame is not rehashed on every rerun.
+"""
+import collections
+import math
+import threading
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+MAX_LEVEL = 20
+MAX_POINTS = 5000
+LEVEL_CACHE_BYTES = 16 * 1024 * 1024
+_METERS_PER_DEGREE = 111_000
+
+
+class GridIndex:
+    """Per-level cell aggregates for a set of lat/lon points."""
+
+    def __init__(self, lat, lon):
+        self.lat = np.asarray(lat, dtype=float)
+        self.lon = np.asarray(lon, dtype=float)
+        self.bounds = (self.lat.min(), self.lat.max(), self.lon.min(), self.lon.max())
+        self._iy = self._quantize(self.lat, *self.bounds[:2])
+        self._ix = self._quantize(self.lon, *self.bounds[2:])
+        self._levels = collections.OrderedDict()
+        self._level_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _quantize(values, lo, hi):
+        span = hi - lo if hi > lo else 1.0
+        scaled = (values - lo) / span * (1 << MAX_LEVEL)
+        return np.clip(scaled.astype(np.int64), 0, (1 << MAX_LEVEL) - 1)
+
+    def cells(self, level):
+        """Returns the non-empty cells at `level` as lat/lon centroids and counts."""
+        with self._lock:
+            if level in self._levels:
+                self._levels.move_to_end(level)
+                return self._levels[level]
+            shift = MAX_LEVEL - level
+            key = ((self._iy >> shift) << level) | (self._ix >> shift)
+            _, inverse, counts = np.unique(key, return_inverse=True, return_counts=True)
+            cells = pd.DataFrame({
+                "lat": np.bincount(inverse, self.lat) / counts,
+                "lon": np.bincount(inverse, self.lon) / counts,
+                "count": counts,
+            })
+            # Fine levels have nearly one cell per point, so only the most
+            # recently used levels are kept; the newest one always is.
+            self._levels[level] = cells
+            self._level_bytes += int(cells.memory_usage().sum())
+            while self._level_bytes > LEVEL_CACHE_BYTES and len(self._levels) > 1:
+                _, evicted = self._levels.popitem(last=False)
+                self._level_bytes -= int(evicted.memory_usage().sum())
+            return cells
+
+    def level_for(self, lat_range, lon_range, max_points):
+        """Returns the finest level with about `max_points` cells across the viewport."""
+        lat_lo, lat_hi, lon_lo, lon_hi = self.bounds
+        zoom = max(
+            (lat_range[1] - lat_range[0]) / ((lat_hi - lat_lo) or 1.0),
+            (lon_range[1] - lon_range[0]) / ((lon_hi - lon_lo) or 1.0),
+            1e-9,
+        )
+        level = math.floor(math.log2(math.sqrt(max_points) / zoom))
+        return max(0, min(MAX_LEVEL, level))
+
+    def query(self, lat_range, lon_range, max_points=MAX_POINTS):
+        """Returns `(points, level)` for the viewport.
+
+        `points` has lat, lon and count columns; `level` is None when the raw
+        points are returned.
+        """
+        # Counting the points in view is cheaper than building a level that
+        # would not be shown.
+        mask = (
+            (self.lat >= lat_range[0]) & (self.lat <= lat_range[1])
+            & (self.lon >= lon_range[0]) & (self.lon <= lon_range[1])
+        )
+        if np.count_nonzero(mask) <= max_points:
+            return pd.DataFrame({"lat": self.lat[mask], "lon": self.lon[mask], "count": 1}), None
+        level = self.level_for(lat_range, lon_range, max_points)
+        cells = self.cells(level)
+        visible = cells[
+            cells["lat"].between(*lat_range) & cells["lon"].between(*lon_range)
+        ]
+        return visible, level
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def build_index(data, lat="lat", lon="lon"):
+    """Returns the shared ``GridIndex`` for `data`."""
+    return GridIndex(data[lat].to_numpy(), data[lon].to_numpy())
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def build_source_index(source, _data, lat="lat", lon="lon"):
+    """Returns the shared ``GridIndex`` for `_data`, cached on `source` alone."""
+    return GridIndex(_data[lat].to_numpy(), _data[lon].to_numpy())
+
+
+def clustered_map(data, key, max_points=MAX_POINTS, lat="lat", lon="lon", source=None):
+    """Draws `data` with ``st.map``, clustered to at most `max_points` dots.
+
+    Latitude/longitude range sliders set the viewport; narrowing them
+    re-queries the index at a finer level. `source` is a hashable that
+    identifies the content of `data`, such as ``datasets.dataset_key(name)``;
+    when given, the index is looked up by it instead of by hashing `data`.
+    """
+    if source is None:
+        index = build_index(data, lat, lon)
+    else:
+        index = build_source_index(source, data, lat, lon)
+    lat_lo, lat_hi, lon_lo, lon_hi = (float(bound) for bound in index.bounds)
+    lat_col, lon_col = st.columns(2)
+    lat_range = lat_col.slider("Latitude", lat_lo, lat_hi, (lat_lo, lat_hi), key=f"{key}_lat")
+    lon_range = lon_col.slider("Longitude", lon_lo, lon_hi, (lon_lo, lon_hi), key=f"{key}_lon")
+    points, level = index.query(lat_range, lon_range, max_points)
+    if level is None:
+        st.map(points, latitude="lat", longitude="lon")
+        st.caption(f"Showing all {len(points):,} points in view.")
+        return
+    # Size each cluster by its share of the cell it stands for.
+    cell_meters = (lat_hi - lat_lo) / (1 << level) * _METERS_PER_DEGREE
+    sizes = cell_meters / 2 * np.sqrt(points["count"] / points["count"].max())
+    st.map(points.assign(size=np.maximum(sizes, 1.0)), latitude="lat", longitude="lon", size="size")
+    st.caption(
+        f"Showing {len(points):,} clusters for {int(points['count'].sum()):,} points "
+        f"(grid level {level})."
+    )
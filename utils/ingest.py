@@ -0,0 +1,62 @@
+"""Chunked CSV ingest for ``st.file_uploader`` previews.
+
+``pd.read_csv(uploaded_file)`` parses the whole upload on every rerun just to
+show its first rows. ``preview_upload()`` parses chunk by chunk, stops as soon
+as the preview is filled, and caches the result by the upload's file id and
+content digest, so later reruns with the same file attached parse nothing.
+The digest itself is computed once per upload and remembered in session
+state by file id, so those reruns do not rehash the file either.
+"""
+import hashlib
+
+import streamlit as st
+import pandas as pd
+
+PREVIEW_ROWS = 5
+CHUNK_ROWS = 1000
+MAX_DIGESTS = 16
+_DIGESTS_KEY = "_upload_digests"
+
+
+def content_digest(uploaded_file):
+    """Returns a BLAKE2 digest of the upload without copying its buffer."""
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+
+
+def _upload_digest(uploaded_file):
+    # A file id names one upload, and its content never changes, so the
+    # digest can be kept for as long as the session holds the id.
+    digests = st.session_state.setdefault(_DIGESTS_KEY, {})
+    digest = digests.get(uploaded_file.file_id)
+    if digest is None:
+        if len(digests) >= MAX_DIGESTS:
+            digests.clear()
+        digest = digests[uploaded_file.file_id] = content_digest(uploaded_file)
+    return digest
+
+
+def preview_upload(uploaded_file, rows=PREVIEW_ROWS):
+    """Returns `(preview, schema)` for an uploaded CSV file.
+
+    `schema` maps each column to the dtype sniffed from the first chunk.
+    """
+    return _preview_csv(
+        uploaded_file.file_id, _upload_digest(uploaded_file), uploaded_file, rows
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _preview_csv(file_id, digest, _file, rows):
+    _file.seek(0)
+    frames = []
+    schema = None
+    with pd.read_csv(_file, chunksize=CHUNK_ROWS) as reader:
+        for chunk in reader:
+            if schema is None:
+                schema = {col: str(dtype) for col, dtype in chunk.dtypes.items()}
+            frames.append(chunk)
+            if sum(len(frame) for frame in frames) >= rows:
+                break
+    if not frames:
+        return pd.DataFrame(), {}
+    return pd.concat(frames).head(rows), schema
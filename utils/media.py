@@ -0,0 +1,201 @@
+"""Local, content-addressed cache for the remote media the demo displays.
+
+Passing a remote URL to ``st.image`` or ``st.audio`` makes every browser fetch
+the asset from its origin on every render, and nothing loads on an air-gapped
+host. The assets are listed by name in ``media_manifest.json``.
+``media_url(name)`` returns the ``/app/static/`` URL of the stored copy under
+``static/media/<sha256><ext>``. An asset that is not stored yet is downloaded
+on a background thread while the origin URL is returned, so a render never
+waits on the network. Streamlit
+serves those files itself (``server.enableStaticServing``) with ETag,
+Last-Modified and range-request support, and because file names are content
+hashes the browser can cache them indefinitely. Requesting a ``width``
+resizes raster images server-side once and serves the resized copy.
+
+Run ``python -m utils.media`` to prefetch every asset and pin its digest in
+the manifest. Copying ``static/media`` alongside the manifest then bundles
+the assets for offline hosts. Set ``DEMO_MEDIA_OFFLINE=1`` to never go to
+the network; assets that are not in the store then fall back to their
+original URL.
+"""
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = ROOT / "media_manifest.json"
+STORE_DIR = ROOT / "static" / "media"
+STATIC_URL = "/app/static/media/"
+FETCH_TIMEOUT = 10
+RETRY_SECONDS = 60
+# Resized copies are rendered at twice the requested CSS width so they stay
+# sharp on high-density screens.
+RESIZE_SCALE = 2
+
+_LOGGER = logging.getLogger(__name__)
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="media-fetch")
+_lock = threading.Lock()
+_name_locks = {}
+_digests = {}
+_failures = {}
+_fetching = set()
+_manifest = None
+
+
+def load_manifest():
+    """Returns the asset manifest, read once per process."""
+    global _manifest
+    if _manifest is None:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            _manifest = json.load(f)
+    return _manifest
+
+
+def _extension(entry):
+    return mimetypes.guess_extension(entry["type"]) or Path(entry["url"]).suffix
+
+
+def _write(path, data):
+    # Write to a temporary file and rename it into place, so concurrent
+    # readers never see a partial file.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _download(entry):
+    request = urllib.request.Request(entry["url"], headers={"User-Agent": "streamlit-demo"})
+    with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def _recently_failed(name):
+    return time.monotonic() - _failures.get(name, -RETRY_SECONDS) < RETRY_SECONDS
+
+
+def asset_path(name, fetch=True):
+    """Returns the local path of asset `name`, downloading it if needed.
+
+    Returns ``None`` if the asset is not stored and cannot be fetched.
+    """
+    entry = load_manifest()[name]
+    ext = _extension(entry)
+    # Content fetched by this process wins over the digest pinned in the
+    # manifest: it is what was stored if the asset changed upstream.
+    for digest in (_digests.get(name), entry.get("sha256")):
+        if digest and (STORE_DIR / f"{digest}{ext}").exists():
+            return STORE_DIR / f"{digest}{ext}"
+    if not fetch or os.environ.get("DEMO_MEDIA_OFFLINE") == "1" or _recently_failed(name):
+        return None
+    with _lock:
+        name_lock = _name_locks.setdefault(name, threading.Lock())
+    with name_lock:
+        # Another session may have fetched it (or given up) while this one waited.
+        if name in _digests:
+            return STORE_DIR / f"{_digests[name]}{ext}"
+        if _recently_failed(name):
+            return None
+        try:
+            data = _download(entry)
+        except OSError as e:
+            _LOGGER.warning("Could not fetch %s from %s: %s", name, entry["url"], e)
+            _failures[name] = time.monotonic()
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        if entry.get("sha256") and entry["sha256"] != digest:
+            _LOGGER.warning("%s changed upstream; serving the new content", name)
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        path = STORE_DIR / f"{digest}{ext}"
+        if not path.exists():
+            _write(path, data)
+        _digests[name] = digest
+        return path
+
+
+def _fetch_in_background(name):
+    if os.environ.get("DEMO_MEDIA_OFFLINE") == "1" or _recently_failed(name):
+        return
+    with _lock:
+        if name in _fetching:
+            return
+        _fetching.add(name)
+
+    def fetch():
+        try:
+            asset_path(name)
+        finally:
+            with _lock:
+                _fetching.discard(name)
+
+    _EXECUTOR.submit(fetch)
+
+
+def _resized(path, width):
+    from PIL import Image
+
+    target = path.with_name(f"{path.stem}-w{width}{path.suffix}")
+    if target.exists():
+        return target
+    with Image.open(path) as image:
+        if image.width <= width:
+            return path
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+        os.close(fd)
+        resized.save(tmp, format=image.format)
+    os.replace(tmp, target)
+    return target
+
+
+def media_url(name, width=None):
+    """Returns a URL for asset `name`, served locally when possible.
+
+    With `width`, raster images wider than ``width * RESIZE_SCALE`` pixels are
+    served as a resized copy, which also makes this the way to get
+    thumbnails. An asset that is not stored yet is served from its remote URL
+    while it is fetched in the background; later calls return the local URL.
+    """
+    path = asset_path(name, fetch=False)
+    if path is None:
+        _fetch_in_background(name)
+        return load_manifest()[name]["url"]
+    if width is not None and load_manifest()[name]["type"].startswith("image/") and path.suffix != ".svg":
+        path = _resized(path, width * RESIZE_SCALE)
+    return STATIC_URL + path.name
+
+
+def prefetch(names=None):
+    """Downloads the assets in `names` (all by default) and pins their digests.
+
+    Returns the names that could not be fetched.
+    """
+    manifest = load_manifest()
+    missing = []
+    for name in names or list(manifest):
+        path = asset_path(name)
+        if path is None:
+            missing.append(name)
+        else:
+            manifest[name]["sha256"] = path.stem
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return missing
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    failed = prefetch()
+    print(f"Stored {len(load_manifest()) - len(failed)} assets in {STORE_DIR}")
+    if failed:
+        print("Could not fetch: " + ", ".join(failed))
@@ -0,0 +1,148 @@
+"""Server-side paging for large frames shown with ``st.dataframe``.
+
+``st.dataframe(df)`` serializes every row to the browser. ``paged_dataframe()``
+keeps the frame on the server and sends only the visible window, with sorting
+and filtering computed server-side. The frame can be a pandas ``DataFrame`` or
+a ``pyarrow.Table`` (including one memory-mapped from an Arrow/Feather file,
+e.g. ``utils.arrow_cache.arrow_table(path)``). Arrow windows are passed to
+``st.dataframe`` as tables, with no pandas round-trip: unsorted windows are
+zero-copy slices of the mapped file, whose serialized bytes
+``utils.arrow_cache`` reuses across reruns. Tables have no index, so the
+rows of an Arrow window are numbered from 0; the caption gives their range.
+"""
+import math
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+PAGE_SIZE = 100
+
+
+def _num_rows(data):
+    return len(data) if isinstance(data, pd.DataFrame) else data.num_rows
+
+
+def _matching_rows(data, text):
+    if isinstance(data, pd.DataFrame):
+        mask = np.zeros(len(data), dtype=bool)
+        for col in data.columns:
+            mask |= data[col].astype(str).str.contains(text, case=False, regex=False).to_numpy()
+        return np.flatnonzero(mask)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    mask = pa.array(np.zeros(data.num_rows, dtype=bool))
+    for col in data.columns:
+        hits = pc.match_substring(pc.cast(col, pa.string()), text, ignore_case=True)
+        mask = pc.or_(mask, pc.fill_null(hits, False))
+    return np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+
+
+def _sorted_rows(data, rows, sort_by, descending):
+    # Missing values sort last in both directions, and ties keep row order.
+    if isinstance(data, pd.DataFrame):
+        column = data[sort_by]
+        if rows is not None:
+            column = column.iloc[rows]
+        column = column.reset_index(drop=True)
+        try:
+            column = column.sort_values(ascending=not descending, kind="stable", na_position="last")
+        except TypeError:
+            # Mixed types in an object column; order them by their text.
+            column = column.where(column.isna(), column.astype(str))
+            column = column.sort_values(ascending=not descending, kind="stable", na_position="last")
+        order = column.index.to_numpy()
+    else:
+        import pyarrow.compute as pc
+        column = data.column(sort_by)
+        if rows is not None:
+            column = column.take(rows)
+        order = pc.array_sort_indices(
+            column, order="descending" if descending else "ascending", null_placement="at_end"
+        ).to_numpy()
+    return order if rows is None else rows[order]
+
+
+def _fingerprint(data):
+    # Arrow buffers are immutable, so a table's buffer addresses identify its
+    # content; pandas frames can be edited in place and are hashed.
+    if isinstance(data, pd.DataFrame):
+        try:
+            return int(pd.util.hash_pandas_object(data).sum())
+        except TypeError:
+            return None
+    return tuple(
+        buf.address if buf is not None else None
+        for column in data.columns for chunk in column.chunks for buf in chunk.buffers()
+    )
+
+
+def _row_positions(data, key, sort_by, descending, text, source):
+    # The ordering is an int array the length of the (filtered) frame, so it
+    # is kept per session and only recomputed when the view spec or the data
+    # changes.
+    if sort_by is None and not text:
+        st.session_state.pop(f"_{key}_rows", None)
+        return None
+    fingerprint = _fingerprint(data) if source is None else source
+    spec = (_num_rows(data), tuple(data.columns), fingerprint, sort_by, descending, text)
+    cached = st.session_state.get(f"_{key}_rows")
+    if cached is not None and cached[0] == spec and spec[2] is not None:
+        return cached[1]
+    rows = _matching_rows(data, text) if text else None
+    if sort_by is not None:
+        rows = _sorted_rows(data, rows, sort_by, descending)
+    st.session_state[f"_{key}_rows"] = (spec, rows)
+    return rows
+
+
+def _window(data, rows, start, stop):
+    if isinstance(data, pd.DataFrame):
+        return data.iloc[start:stop] if rows is None else data.iloc[rows[start:stop]]
+    if rows is None:
+        return data.slice(start, stop - start)
+    return data.take(rows[start:stop])
+
+
+def paged_dataframe(data, key, page_size=PAGE_SIZE, source=None, **kwargs):
+    """Displays one page of `data` and returns the selected row positions.
+
+    A sorted or filtered view is cached until `data` changes, which for a
+    pandas frame means hashing it on every rerun. `source` is a hashable
+    that identifies the content of `data` instead, such as
+    ``datasets.dataset_key(name)`` for a shared dataset or a version
+    counter; pass it for large frames. Extra keyword arguments are passed to
+    ``st.dataframe``. With
+    ``on_select="rerun"``, the returned array holds the absolute positions of
+    the selected rows in `data` (usable with ``data.iloc``); otherwise it is
+    empty.
+    """
+    sort_col, order_col, filter_col, page_col = st.columns([2, 1, 2, 1])
+    sort_by = sort_col.selectbox(
+        "Sort by", [None, *data.columns], key=f"{key}_sort",
+        format_func=lambda col: "(unsorted)" if col is None else str(col)
+    )
+    descending = order_col.toggle("Descending", key=f"{key}_descending")
+    text = filter_col.text_input("Filter rows containing", key=f"{key}_filter")
+
+    rows = _row_positions(data, key, sort_by, descending, text, source)
+    total = _num_rows(data) if rows is None else len(rows)
+    pages = max(1, math.ceil(total / page_size))
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = page_col.number_input("Page", 1, pages, key=f"{key}_page")
+    start = min((page - 1) * page_size, total)
+    stop = min(start + page_size, total)
+
+    # The view spec is part of the element key so a selection made on one
+    # window is not carried over to a different one.
+    event = st.dataframe(
+        _window(data, rows, start, stop),
+        key=f"{key}_{page}_{sort_by}_{descending}_{text}",
+        **kwargs
+    )
+    st.caption(f"Rows {start + 1 if total else 0}–{stop} of {total:,}")
+    if kwargs.get("on_select", "ignore") == "ignore":
+        return np.array([], dtype=np.int64)
+    positions = np.asarray(event.selection.rows, dtype=np.int64) + start
+    return positions if rows is None else rows[positions]
@@ -0,0 +1,48 @@
+"""Matplotlib rendering helpers that never touch pyplot's figure registry.
+
+``plt.subplots()``/``plt.figure()`` register every figure in pyplot's global
+state, which is shared by all sessions and only shrinks on ``plt.close``.
+These helpers build standalone ``Figure`` objects on an Agg canvas instead, so
+a figure is garbage collected as soon as it has been rasterized, and cache the
+resulting PNG bytes keyed by the plot inputs.
+"""
+import io
+
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def new_figure(**kwargs):
+    """Returns a `(fig, ax)` pair that is not tracked by pyplot."""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def figure_to_png(fig):
+    """Rasterizes `fig` to PNG bytes and releases its artists."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    fig.clear()
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def histogram_png(values, bins=20, title=None):
+    """Returns a cached PNG of a histogram over `values`."""
+    fig, ax = new_figure()
+    ax.hist(values, bins=bins)
+    if title:
+        ax.set_title(title)
+    return figure_to_png(fig)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def line_png(x, y, title=None):
+    """Returns a cached PNG of a line plot of `y` against `x`."""
+    fig, ax = new_figure()
+    ax.plot(x, y)
+    if title:
+        ax.set_title(title)
+    return figure_to_png(fig)
@@ -0,0 +1,115 @@
+"""Process-wide resources that are built ahead of time on a thread pool.
+
+With ``st.cache_resource`` the first session that calls the loader pays for
+it. ``warm_resource`` registers a loader instead; ``prewarm()`` imports the
+modules that define them and builds every registered resource in the
+background as soon as the server runs its first script, and ``refresh()``
+rebuilds a resource while the previous instance keeps serving callers.
+"""
+import functools
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prewarm")
+_REGISTRY = {}
+_started = False
+_started_lock = threading.Lock()
+
+
+class WarmResource:
+    """A lazily shared resource whose builds run on the prewarm pool."""
+
+    def __init__(self, loader):
+        functools.update_wrapper(self, loader)
+        self._loader = loader
+        self._value = None
+        self._ready = threading.Event()
+        self._pending = None
+        self._lock = threading.Lock()
+
+    def _build(self):
+        try:
+            self._value = self._loader()
+            self._ready.set()
+            return self._value
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def refresh(self):
+        """Schedules a rebuild unless one is running; returns its future.
+
+        Callers keep getting the current instance until the rebuild finishes.
+        """
+        with self._lock:
+            if self._pending is None:
+                self._pending = _EXECUTOR.submit(self._build)
+            return self._pending
+
+    def __call__(self):
+        if not self._ready.is_set():
+            # Only the very first use waits, and only for what is left of
+            # the build that is already under way.
+            self.refresh().result()
+        return self._value
+
+    def status(self):
+        """Returns "ready", "refreshing", "warming" or "cold"."""
+        if self._ready.is_set():
+            return "refreshing" if self._pending is not None else "ready"
+        return "warming" if self._pending is not None else "cold"
+
+
+def warm_resource(loader):
+    """Decorator registering `loader` as a prewarmed, shared resource."""
+    resource = WarmResource(loader)
+    _REGISTRY[f"{loader.__module__}.{loader.__qualname__}"] = resource
+    return resource
+
+
+def _warm_modules(modules):
+    for module in modules:
+        importlib.import_module(module)
+    for resource in list(_REGISTRY.values()):
+        if resource.status() == "cold":
+            resource.refresh()
+
+
+def prewarm(*modules):
+    """Imports `modules` and builds their resources in the background.
+
+    Only the first call in a process does anything, so this is safe to call
+    at the top of the app script.
+    """
+    global _started
+    with _started_lock:
+        if _started:
+            return
+        _started = True
+    _EXECUTOR.submit(_warm_modules, modules)
+
+
+def warm_now(*modules):
+    """Imports `modules` and builds every cold resource in the calling thread.
+
+    Meant for a parent process that forks server workers (see ``serve.py``):
+    resources built before the fork are shared copy-on-write by all workers,
+    and the prewarm pool has no threads yet that the fork would lose.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    for resource in list(_REGISTRY.values()):
+        if resource.status() == "cold":
+            resource._build()
+
+
+def readiness():
+    """Returns ``{resource name: status}`` for every registered resource."""
+    return {resource.__name__: resource.status() for resource in _REGISTRY.values()}
+
+
+def refresh_all():
+    """Rebuilds every registered resource in the background."""
+    for resource in _REGISTRY.values():
+        resource.refresh()
@@ -0,0 +1,245 @@
+"""Rerun profiler for the demo app.
+
+When enabled from the sidebar, every public ``st.*`` element call made on the
+script thread is timed, along with the protobuf bytes it enqueues for the
+browser and, optionally, the net memory it allocated (via ``tracemalloc``).
+Calls nest, so ``st.write`` shows the elements it emits as children, and
+``span()`` adds named branches such as the selected section, and ``count()``
+adds per-rerun counters (e.g. the Arrow cache's savings). The result is
+shown in a sidebar panel and can be exported as JSON or as folded stacks for
+flamegraph tools (``flamegraph.pl``, speedscope).
+
+Instrumentation is installed on first use and is a thread-local lookup per
+call while no profile is active; background threads are never recorded.
+"""
+import collections
+import contextlib
+import functools
+import inspect
+import json
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+_tracing_runs = 0
+
+
+class Span:
+    """One timed call or branch in a rerun profile."""
+
+    def __init__(self, name):
+        self.name = name
+        self.wall = 0.0
+        self.allocated = 0
+        self.payload = 0
+        self.children = []
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "wall_ms": round(self.wall * 1000, 3),
+            "allocated_bytes": self.allocated,
+            "payload_bytes": self.payload,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class RerunProfile:
+    """The span tree recorded for one script run."""
+
+    def __init__(self, track_allocations=False):
+        self.root = Span("rerun")
+        self.track_allocations = track_allocations
+        self.counters = collections.Counter()
+        self._stack = [self.root]
+
+    @contextlib.contextmanager
+    def span(self, name):
+        node = Span(name)
+        parent = self._stack[-1]
+        parent.children.append(node)
+        self._stack.append(node)
+        mem_before = tracemalloc.get_traced_memory()[0] if self.track_allocations else 0
+        start = time.perf_counter()
+        try:
+            yield node
+        finally:
+            node.wall = time.perf_counter() - start
+            if self.track_allocations:
+                node.allocated = tracemalloc.get_traced_memory()[0] - mem_before
+            self._stack.pop()
+            parent.payload += node.payload
+
+    def add_payload(self, nbytes):
+        self._stack[-1].payload += nbytes
+
+    def to_dict(self):
+        return {**self.root.to_dict(), "counters": dict(self.counters)}
+
+    def folded(self):
+        """Returns self wall time per call stack in folded-stack format (µs)."""
+        lines = []
+
+        def walk(node, prefix):
+            path = f"{prefix};{node.name}" if prefix else node.name
+            own = node.wall - sum(child.wall for child in node.children)
+            if own > 0:
+                lines.append(f"{path} {round(own * 1e6)}")
+            for child in node.children:
+                walk(child, path)
+
+        walk(self.root, "")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """Returns per-name totals as a list of dicts, slowest first."""
+        totals = {}
+
+        def walk(node):
+            for child in node.children:
+                entry = totals.setdefault(child.name, {
+                    "call": child.name, "count": 0, "wall_ms": 0.0,
+                    "payload_bytes": 0, "allocated_bytes": 0,
+                })
+                entry["count"] += 1
+                entry["wall_ms"] += child.wall * 1000
+                entry["payload_bytes"] += child.payload
+                entry["allocated_bytes"] += child.allocated
+                walk(child)
+
+        walk(self.root)
+        return sorted(totals.values(), key=lambda entry: entry["wall_ms"], reverse=True)
+
+
+def active_profile():
+    """Returns the profile recording on this thread, or None."""
+    return getattr(_local, "profile", None)
+
+
+def _instrument(name, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        profile = active_profile()
+        if profile is None:
+            return method(*args, **kwargs)
+        with profile.span(f"st.{name}"):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def _instrument_enqueue(method):
+    @functools.wraps(method)
+    def wrapper(self, delta_type, element_proto, *args, **kwargs):
+        profile = active_profile()
+        if profile is not None:
+            profile.add_payload(element_proto.ByteSize())
+        return method(self, delta_type, element_proto, *args, **kwargs)
+    return wrapper
+
+
+def install():
+    """Wraps the public ``DeltaGenerator`` methods once per process.
+
+    ``st.header`` and friends are methods bound to the main container when
+    streamlit is imported, so the module attributes are wrapped as well.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for name in dir(DeltaGenerator):
+            if name.startswith("_") or name == "dg":
+                continue
+            attr = inspect.getattr_static(DeltaGenerator, name)
+            if inspect.isfunction(attr):
+                setattr(DeltaGenerator, name, _instrument(name, attr))
+        for name in dir(st):
+            attr = getattr(st, name)
+            if inspect.ismethod(attr) and isinstance(attr.__self__, DeltaGenerator):
+                setattr(st, name, _instrument(name, attr))
+        DeltaGenerator._enqueue = _instrument_enqueue(DeltaGenerator._enqueue)
+        _installed = True
+
+
+@contextlib.contextmanager
+def profile_rerun(enabled, track_allocations=False):
+    """Records the enclosed script run on this thread if `enabled`.
+
+    Yields the ``RerunProfile``, or None when profiling is off.
+    """
+    global _tracing_runs
+    if not enabled:
+        yield None
+        return
+    install()
+    if track_allocations:
+        with _install_lock:
+            _tracing_runs += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+    profile = RerunProfile(track_allocations)
+    _local.profile = profile
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.root.wall = time.perf_counter() - start
+        _local.profile = None
+        if track_allocations:
+            with _install_lock:
+                _tracing_runs -= 1
+                if _tracing_runs == 0:
+                    tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def span(name):
+    """Times the enclosed block as `name` when a profile is active."""
+    profile = active_profile()
+    if profile is None:
+        yield None
+        return
+    with profile.span(name) as node:
+        yield node
+
+
+def count(name, amount=1):
+    """Adds `amount` to counter `name` when a profile is active."""
+    profile = active_profile()
+    if profile is not None:
+        profile.counters[name] += amount
+
+
+def profiler_panel(profile):
+    """Renders the profiler toggles and the last profile in the sidebar."""
+    with st.sidebar.expander("Rerun Profiler", expanded=profile is not None):
+        st.toggle("Profile reruns", key="profile_reruns")
+        st.toggle("Track allocations (slower)", key="profile_allocations")
+        if profile is None:
+            st.caption("Turn on profiling to record the next rerun.")
+            return
+        root = profile.root
+        st.caption(
+            f"Rerun took {root.wall * 1000:.1f} ms and sent "
+            f"{root.payload / 1024:.1f} KB of element payload."
+        )
+        st.dataframe(profile.summary(), hide_index=True)
+        if profile.counters:
+            st.caption(", ".join(
+                f"{name}: {value:,.1f}" if isinstance(value, float) else f"{name}: {value:,}"
+                for name, value in sorted(profile.counters.items())
+            ))
+        st.download_button(
+            "Export JSON", data=json.dumps(profile.to_dict(), indent=2),
+            file_name="rerun_profile.json", mime="application/json"
+        )
+        st.download_button(
+            "Export Flamegraph (folded stacks)", data=profile.folded(),
+            file_name="rerun_profile.folded", mime="text/plain"
+        )
@@ -0,0 +1,235 @@
+"""Per-session memory accounting and a spillable store for large values.
+
+Everything in ``st.session_state`` stays in server memory for as long as the
+session lives, and ``st.write(st.session_state)`` serializes all of it.
+This module estimates the bytes each session holds, keeps large values in a
+``SessionStore`` that moves idle or least recently used entries to a
+per-session temporary directory (or drops them, with ``spill=False``) once
+the session goes over its byte cap, and summarizes session state as one row
+per key for display. Stores are also swept by a background thread every
+``SWEEP_SECONDS``, so idle values are spilled even in sessions that stopped
+rerunning.
+
+The cap defaults to 64 MB and can be set with the ``DEMO_SESSION_BYTE_CAP``
+environment variable.
+"""
+import collections
+import logging
+import os
+import pickle
+import reprlib
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import streamlit as st
+
+SESSION_BYTE_CAP = int(os.environ.get("DEMO_SESSION_BYTE_CAP", 64 * 1024 * 1024))
+IDLE_SECONDS = 300
+SWEEP_SECONDS = 60
+_STORE_KEY = "_large_values"
+_SIZES_KEY = "_value_sizes"
+
+_LOGGER = logging.getLogger(__name__)
+_stores = weakref.WeakSet()
+_sweeper = None
+_sweeper_lock = threading.Lock()
+
+
+def value_size(value, _depth=0, _seen=None):
+    """Returns an estimate of the bytes `value` keeps alive."""
+    if isinstance(value, SessionStore):
+        return value.memory_bytes
+    # Duck-typed so this module does not import pandas/numpy itself.
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        usage = memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if _depth >= 4 or not isinstance(value, (dict, list, tuple, set, frozenset)):
+        return size
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    items = value.items() if isinstance(value, dict) else ((item, None) for item in value)
+    for item, other in items:
+        size += value_size(item, _depth + 1, _seen)
+        if other is not None:
+            size += value_size(other, _depth + 1, _seen)
+    return size
+
+
+def _sweep():
+    for store in list(_stores):
+        try:
+            store.release_idle()
+        except Exception:
+            _LOGGER.exception("Could not release idle session values")
+
+
+def _sweep_forever():
+    # The stores are only referenced inside _sweep(), so a closed session's
+    # store is not kept alive between sweeps.
+    while True:
+        time.sleep(SWEEP_SECONDS)
+        _sweep()
+
+
+def _register(store):
+    global _sweeper
+    with _sweeper_lock:
+        _stores.add(store)
+        if _sweeper is None:
+            _sweeper = threading.Thread(target=_sweep_forever, name="session-store-sweeper", daemon=True)
+            _sweeper.start()
+
+
+class SessionStore:
+    """Large per-session values that can be spilled to disk or evicted."""
+
+    def __init__(self, spill=True):
+        self.spill = spill
+        # key -> [value, size, last_used, spill path]; value is None once
+        # spilled (path set) or evicted (path None).
+        self._entries = collections.OrderedDict()
+        self._tmpdir = None
+        # The sweeper thread releases entries while the session's script runs.
+        self._lock = threading.RLock()
+        _register(self)
+
+    @property
+    def memory_bytes(self):
+        with self._lock:
+            return sum(entry[1] for entry in self._entries.values() if entry[0] is not None)
+
+    def put(self, key, value):
+        size = value_size(value)
+        with self._lock:
+            self.pop(key)
+            self._entries[key] = [value, size, time.monotonic(), None]
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] is None:
+                if entry[3] is None:
+                    return default
+                with open(entry[3], "rb") as f:
+                    entry[0] = pickle.load(f)
+                entry[3].unlink(missing_ok=True)
+                entry[3] = None
+            entry[2] = time.monotonic()
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[3] is not None:
+                entry[3].unlink(missing_ok=True)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def _release(self, key, entry):
+        if self.spill:
+            if self._tmpdir is None:
+                # Removed with the store when the session is garbage collected.
+                self._tmpdir = tempfile.TemporaryDirectory(prefix="session-spill-")
+            fd, path = tempfile.mkstemp(suffix=".pkl", dir=self._tmpdir.name)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry[0], f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry[3] = Path(path)
+        entry[0] = None
+
+    def release_idle(self, idle_seconds=IDLE_SECONDS):
+        """Releases entries not used for `idle_seconds`."""
+        now = time.monotonic()
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry[0] is not None and now - entry[2] > idle_seconds:
+                    self._release(key, entry)
+
+    def enforce(self, budget, idle_seconds=IDLE_SECONDS):
+        """Releases idle entries, then LRU entries until within `budget` bytes."""
+        with self._lock:
+            self.release_idle(idle_seconds)
+            for key, entry in self._entries.items():
+                if self.memory_bytes <= budget:
+                    break
+                if entry[0] is not None:
+                    self._release(key, entry)
+
+    def rows(self):
+        """Returns `(key, bytes, location)` for every entry."""
+        with self._lock:
+            entries = list(self._entries.items())
+        for key, (value, size, _, path) in entries:
+            location = "memory" if value is not None else "disk" if path else "evicted"
+            yield key, size, location
+
+
+def _preview(value):
+    if isinstance(getattr(value, "shape", None), tuple):
+        return f"{type(value).__name__} of shape {value.shape}"
+    return reprlib.repr(value)
+
+
+def large_values():
+    """Returns this session's ``SessionStore``."""
+    if _STORE_KEY not in st.session_state:
+        st.session_state[_STORE_KEY] = SessionStore()
+    return st.session_state[_STORE_KEY]
+
+
+def _state_sizes():
+    # Sizes are remembered with the value they were measured for and only
+    # re-measured when a key is assigned a different object, so replace
+    # values instead of growing them in place.
+    known = st.session_state.get(_SIZES_KEY, {})
+    measured = {}
+    for key, value in st.session_state.items():
+        if key in (_STORE_KEY, _SIZES_KEY):
+            continue
+        entry = known.get(key)
+        measured[key] = entry if entry is not None and entry[0] is value else (value, value_size(value))
+    st.session_state[_SIZES_KEY] = measured
+    return measured
+
+
+def enforce_session_budget(cap=SESSION_BYTE_CAP):
+    """Keeps this session's estimated memory under `cap` bytes.
+
+    Only values in the ``SessionStore`` are released; everything else in
+    session state counts against the cap but stays put.
+    """
+    store = st.session_state.get(_STORE_KEY)
+    if store is None:
+        return
+    other = sum(size for _, size in _state_sizes().values())
+    store.enforce(max(0, cap - other))
+
+
+def session_summary():
+    """Returns one row per session state key with its type, size and location."""
+    import pandas as pd
+
+    rows = [
+        (key, type(value).__name__, size, "session_state", _preview(value))
+        for key, (value, size) in _state_sizes().items()
+    ]
+    store = st.session_state.get(_STORE_KEY)
+    if store is not None:
+        for key, size, location in store.rows():
+            rows.append((key, "large value", size, location, ""))
+    return pd.DataFrame(rows, columns=["key", "type", "bytes", "location", "preview"])
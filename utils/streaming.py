@@ -0,0 +1,198 @@
+"""Bounded live tables and charts fed by background producers.
+
+``element.add_rows`` sends only the new rows, but the element keeps every row
+it has ever received. ``StreamingTable`` puts a ring buffer of ``max_rows`` in
+front of it: rows are appended as deltas until the element holds twice the
+limit, at which point it is redrawn from the buffer, so the cost per row stays
+constant and the element never grows past ``2 * max_rows``.
+
+Producers run in their own thread (or an asyncio task on another thread's
+loop) and never touch Streamlit; they push rows through a bounded queue that
+blocks them when the script thread falls behind. The script thread drains the
+queue in batches at most every ``flush_interval`` seconds. Once ``run``
+returns, or is interrupted by a rerun, the table is stopped: ``put`` and
+``aput`` return ``False`` instead of blocking, so producers can exit.
+
+On Streamlit versions without ``add_rows`` every batch redraws the buffer
+instead, which is still bounded by ``max_rows`` and the flush interval.
+
+``stream_text()`` does the same for token streams such as chat replies:
+tokens are coalesced into at most ``max_rate`` updates per second of one
+placeholder, and each finished paragraph is frozen into its own element so
+an update resends only the paragraph still being written, not the whole
+reply.
+"""
+import asyncio
+import collections
+import queue
+import threading
+import time
+
+import streamlit as st
+import pandas as pd
+from streamlit.delta_generator import DeltaGenerator
+
+_CLOSED = object()
+_HAS_ADD_ROWS = hasattr(DeltaGenerator, "add_rows")
+
+
+class StreamingTable:
+    """A live ``st.dataframe`` or ``st.line_chart`` with a bounded row buffer."""
+
+    def __init__(self, columns, max_rows=500, max_pending=1000,
+                 flush_interval=0.2, kind="dataframe"):
+        self.columns = list(columns)
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.kind = kind
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._buffer = collections.deque(maxlen=max_rows)
+        self._next_id = 0
+        self._shown = 0
+        self._element = None
+        self._placeholder = None
+        self._stopped = threading.Event()
+
+    @property
+    def stopped(self):
+        """True once ``run`` has returned; no more rows are accepted."""
+        return self._stopped.is_set()
+
+    def put(self, row, timeout=None, poll_interval=0.1):
+        """Queues one row, blocking while `max_pending` rows are waiting.
+
+        Returns ``True`` once the row is queued, or ``False`` if the table is
+        stopped. Raises ``queue.Full`` if `timeout` seconds pass first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._stopped.is_set():
+            wait = poll_interval if deadline is None else min(poll_interval, deadline - time.monotonic())
+            try:
+                self._queue.put(row, timeout=max(0, wait))
+                return True
+            except queue.Full:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+        return False
+
+    async def aput(self, row, poll_interval=0.01):
+        """Async variant of ``put`` that yields to the loop while full."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put_nowait(row)
+                return True
+            except queue.Full:
+                await asyncio.sleep(poll_interval)
+        return False
+
+    def close(self):
+        """Signals that the producer is done; ``run`` returns after draining."""
+        self.put(_CLOSED)
+
+    def _frame(self, rows, first_id):
+        return pd.DataFrame(
+            rows, columns=self.columns,
+            index=pd.RangeIndex(first_id, first_id + len(rows))
+        )
+
+    def _redraw(self):
+        first_id = self._next_id - len(self._buffer)
+        frame = self._frame(list(self._buffer), first_id)
+        self._element = getattr(self._placeholder, self.kind)(frame)
+        self._shown = len(frame)
+
+    def _flush(self, rows):
+        batch = self._frame(rows, self._next_id)
+        self._next_id += len(rows)
+        self._buffer.extend(rows)
+        if self._element is None or not _HAS_ADD_ROWS or self._shown + len(rows) > 2 * self.max_rows:
+            self._redraw()
+        else:
+            self._element.add_rows(batch)
+            self._shown += len(rows)
+
+    def run(self, container=st, idle_timeout=30):
+        """Renders the element in `container` and streams rows until closed.
+
+        Also returns if no row arrives for `idle_timeout` seconds (``None``
+        waits forever), so a producer that died without calling ``close``
+        does not hang the script. Must be called from the script thread.
+        """
+        self._placeholder = container.empty()
+        try:
+            if self._buffer:
+                self._redraw()
+            last_row = time.monotonic()
+            done = False
+            while not done:
+                rows = []
+                deadline = time.monotonic() + self.flush_interval
+                while len(rows) < self.max_rows:
+                    try:
+                        row = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if row is _CLOSED:
+                        done = True
+                        break
+                    rows.append(row)
+                if rows:
+                    last_row = time.monotonic()
+                    self._flush(rows)
+                elif idle_timeout is not None and time.monotonic() - last_row > idle_timeout:
+                    done = True
+        finally:
+            self._stopped.set()
+
+
+class _TextFrames:
+    """Coalesces streamed text into rate-limited placeholder updates."""
+
+    def __init__(self, container, max_rate):
+        self.container = container
+        self.interval = 1 / max_rate
+        self.slot = container.empty()
+        self.done = []
+        self.open = ""
+        self.last_flush = 0.0
+
+    def add(self, token):
+        self.open += str(token)
+        if time.monotonic() - self.last_flush >= self.interval:
+            self.flush()
+
+    def flush(self, final=False):
+        head, sep, tail = self.open.rpartition("\n\n")
+        # Splitting inside a code fence would break its rendering.
+        if sep and head.count("```") % 2 == 0:
+            self.slot.markdown(head)
+            self.done.append(head + sep)
+            self.slot = self.container.empty()
+            self.open = tail
+        if self.open:
+            self.slot.markdown(self.open if final else self.open + " ▌")
+        self.last_flush = time.monotonic()
+
+    def text(self):
+        return "".join(self.done) + self.open
+
+
+def stream_text(source, container=st, max_rate=15):
+    """Writes the tokens of `source` to `container` as they arrive.
+
+    `source` is an iterable or an async iterable of strings. The text is
+    redrawn at most `max_rate` times per second. Returns the full text, so
+    callers can store it and render it once on later reruns.
+    Must be called from the script thread.
+    """
+    frames = _TextFrames(container, max_rate)
+    if hasattr(source, "__aiter__"):
+        async def consume():
+            async for token in source:
+                frames.add(token)
+        asyncio.run(consume())
+    else:
+        for token in source:
+            frames.add(token)
+    frames.flush(final=True)
+    return frames.text()
@@ -0,0 +1,89 @@
+"""Memoized, vectorized rendering for common ``pandas.Styler`` chains.
+
+``df.style.highlight_max().background_gradient()`` is recomputed on every
+rerun, and pandas builds each cell's CSS in a Python loop. ``styled_frame()``
+takes the chain as data instead, e.g.::
+
+    styled_frame(df, ("highlight_max", {"axis": 0}),
+                 ("background_gradient", {"cmap": "viridis"}))
+
+For the rules in ``_FAST_RULES`` the CSS is computed with whole-array NumPy
+and colormap calls and stored compactly: a palette of the distinct CSS
+strings plus one small integer code array per column. That result is cached
+by the frame's content hash and the chain. Any other chain falls back to
+calling the ``Styler`` methods as usual.
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+
+def _highlight_max(values, color="yellow", axis=0):
+    return np.where(values == np.nanmax(values, axis=0), f"background-color: {color};", "")
+
+
+def _background_gradient(values, cmap="PuBu", low=0, high=0, axis=0,
+                         text_color_threshold=0.408):
+    import matplotlib
+
+    smin = np.nanmin(values, axis=0)
+    smax = np.nanmax(values, axis=0)
+    rng = smax - smin
+    lo, hi = smin - rng * low, smax + rng * high
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm = np.where(hi > lo, (values - lo) / (hi - lo), 0.0)
+    rgba = matplotlib.colormaps.get_cmap(cmap)(norm)
+
+    # Same W3C relative luminance and hex rounding as pandas, on whole arrays.
+    rgb = rgba[..., :3]
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+    text = np.where(luminance < text_color_threshold, "#f1f1f1", "#000000")
+
+    channels = np.round(rgb * 255).astype(np.int64)
+    packed = (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
+    colors, inverse = np.unique(packed, return_inverse=True)
+    hex_colors = np.array([f"#{color:06x}" for color in colors])[inverse.reshape(packed.shape)]
+    return "background-color: " + hex_colors.astype(object) + ";color: " + text.astype(object) + ";"
+
+
+_FAST_RULES = {
+    "highlight_max": (_highlight_max, {"color", "axis"}),
+    "background_gradient": (
+        _background_gradient, {"cmap", "low", "high", "axis", "text_color_threshold"}
+    ),
+}
+
+
+def _is_fast(df, rules):
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return False
+    for name, kwargs in rules:
+        if name not in _FAST_RULES or not set(kwargs) <= _FAST_RULES[name][1]:
+            return False
+        if kwargs.get("axis", 0) != 0:
+            return False
+    return True
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _style_codes(df, rules):
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    css = np.full(values.shape, "", dtype=object)
+    for name, kwargs in rules:
+        css = css + _FAST_RULES[name][0](values, **kwargs)
+    palette, codes = np.unique(css.astype(str), return_inverse=True)
+    codes = codes.reshape(values.shape).astype(np.min_scalar_type(len(palette)))
+    return palette, {col: codes[:, i] for i, col in enumerate(df.columns)}
+
+
+def styled_frame(df, *rules):
+    """Returns a ``Styler`` for `df` with the `(method, kwargs)` chain applied."""
+    if not _is_fast(df, rules):
+        styler = df.style
+        for name, kwargs in rules:
+            styler = getattr(styler, name)(**kwargs)
+        return styler
+    palette, codes = _style_codes(df, rules)
+    css = pd.DataFrame({col: palette[code] for col, code in codes.items()}, index=df.index)
+    return df.style.apply(lambda _: css, axis=None)
@@ -0,0 +1,92 @@
+"""Long-running work on a worker pool, with throttled progress in the UI.
+
+Blocking the script thread with ``time.sleep`` loops keeps the session from
+handling anything else until the loop ends. ``start_task()`` runs the work on
+a shared thread pool instead and keeps the task in ``st.session_state``, so a
+rerun that happens while it is still running reattaches to it rather than
+starting it again. Workers report progress through a ``ProgressChannel``
+that only keeps the latest value, and ``task_status()`` polls it from a
+fragment at a fixed maximum refresh rate, however often the worker reports.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="task")
+
+
+class ProgressChannel:
+    """Latest-value-wins progress updates from a worker to the UI."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = (None, None)
+
+    def report(self, fraction=None, text=None):
+        """Records progress as a 0-1 `fraction` and/or a status `text`."""
+        with self._lock:
+            self._value = (fraction, text)
+
+    def latest(self):
+        """Returns the most recent `(fraction, text)` pair."""
+        with self._lock:
+            return self._value
+
+
+class Task:
+    """A handle to work submitted with ``start_task``."""
+
+    def __init__(self, future, channel):
+        self.future = future
+        self.channel = channel
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+def start_task(key, fn, *args, **kwargs):
+    """Runs ``fn(channel, *args, **kwargs)`` on the pool once per session.
+
+    Returns the existing task stored under `key` if there is one, finished or
+    not; call ``forget_task(key)`` to allow it to run again.
+    """
+    task = st.session_state.get(key)
+    if task is None:
+        channel = ProgressChannel()
+        task = Task(_EXECUTOR.submit(fn, channel, *args, **kwargs), channel)
+        st.session_state[key] = task
+    return task
+
+
+def forget_task(key):
+    """Drops the task stored under `key` (it is not cancelled if running)."""
+    st.session_state.pop(key, None)
+
+
+def task_status(task, text, refresh_rate=10):
+    """Shows `task`'s progress and returns whether it has finished.
+
+    While the task runs, a fragment redraws a progress bar (or a running
+    status if no fraction was reported) at most `refresh_rate` times per
+    second, then triggers a full rerun once the task is done so the caller
+    can render ``task.result()``.
+    """
+    if task.done():
+        return True
+
+    @st.fragment(run_every=1 / refresh_rate)
+    def poll():
+        if task.done():
+            st.rerun()
+        fraction, message = task.channel.latest()
+        if fraction is None:
+            st.status(message or text, state="running")
+        else:
+            st.progress(fraction, text=message or text)
+
+    poll()
+    return False